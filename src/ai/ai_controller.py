@@ -4,7 +4,8 @@ from typing import TYPE_CHECKING
 
 from src.ai.ai_tactics import TacticalAI, ActionType
 from src.ai.ai_strategies import StrategicAI
-from src.core.settings import AI_PERSONALITIES
+from src.ai.utility_functions import get_enemy_positions
+from src.core.settings import AI_PERSONALITIES, AI_PERSONALITY_WEIGHTS
 
 if TYPE_CHECKING:
     from src.core.game_state import GameState
@@ -29,9 +30,10 @@ class AIController:
             AI_PERSONALITIES["BALANCED"]
         )
 
-        # Initialize sub-controllers
-        self.tactical_ai = TacticalAI(self.personality_weights)
-        self.strategic_ai = StrategicAI(self.personality_weights)
+        # Sub-controllers take the record form to skip per-call dict lookups
+        weights = AI_PERSONALITY_WEIGHTS.get(personality, AI_PERSONALITY_WEIGHTS["BALANCED"])
+        self.tactical_ai = TacticalAI(weights)
+        self.strategic_ai = StrategicAI(weights)
 
     def take_turn(self, game_state: 'GameState') -> None:
         """Process a complete AI turn.
@@ -42,6 +44,9 @@ class AIController:
         if self.civ.is_eliminated:
             return
 
+        self.tactical_ai.reset_caches()
+        self.strategic_ai.reset_turn()
+
         # Strategic decisions
         self._make_strategic_decisions(game_state)
 
@@ -72,6 +77,9 @@ class AIController:
         """
         units = game_state.get_units_for_civ(self.civ)
 
+        # Enemies only disappear during our turn, so snapshot them once
+        self.tactical_ai.enemy_xy = get_enemy_positions(self.civ, game_state)
+
         for unit in units:
             if not unit.is_alive:
                 continue
@@ -87,10 +95,15 @@ class AIController:
                 if not success:
                     break  # Action failed, stop trying
 
+                if action.action_type == ActionType.ATTACK:
+                    self.tactical_ai.enemy_xy = get_enemy_positions(self.civ, game_state)
+
                 # Check if unit died
                 if not unit.is_alive:
                     break
 
+        self.tactical_ai.enemy_xy = None
+
 
 def create_ai_controller(civ: 'Civilization') -> AIController:
     """Create an AI controller for a civilization.
@@ -1,17 +1,34 @@
 """Strategic AI for civilization-level decisions."""
 
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Optional, Union
 from dataclasses import dataclass
 from enum import Enum, auto
 
-from src.ai.utility_functions import calculate_production_utility, calculate_research_utility
-from src.data.unit_data import get_available_units
-from src.data.tech_data import get_available_techs
+from src.ai.utility_functions import (
+    as_personality_weights,
+    calculate_production_utility,
+    calculate_research_utility,
+)
+from src.core.settings import PersonalityWeights
+from src.data.tech_data import get_available_techs_for_mask, get_available_units_for_mask
 
 if TYPE_CHECKING:
     from src.core.game_state import GameState
     from src.entities.civilization import Civilization
     from src.entities.city import City
+    from src.data.unit_data import UnitType
+
+
+# Enemy units closer than this to one of our cities add threat
+THREAT_RADIUS = 5
+
+# Threat contributed by an enemy unit at each distance: (5 - dist) * 0.1
+THREAT_BY_DISTANCE = tuple((THREAT_RADIUS - dist) * 0.1 for dist in range(THREAT_RADIUS))
+
+# Stand-in values for refinements skipped when the time budget runs out
+UNASSESSED_THREAT = 0.0
+UNASSESSED_EXPANSION = 0.5
 
 
 class StrategicGoal(Enum):
@@ -36,28 +53,53 @@ class StrategicAssessment:
 class StrategicAI:
     """Handles strategic decisions for a civilization."""
 
-    def __init__(self, personality_weights: dict[str, float]):
+    def __init__(self, personality_weights: Union[dict[str, float], PersonalityWeights]):
         """Initialize strategic AI.
 
         Args:
-            personality_weights: AI personality weights
+            personality_weights: AI personality weights, as a dict or PersonalityWeights
         """
-        self.personality_weights = personality_weights
+        self.personality_weights = as_personality_weights(personality_weights)
 
-    def assess_situation(self, civ: 'Civilization', game_state: 'GameState') -> StrategicAssessment:
+        # Best unit per (civ, researched techs, resources), valid for one turn
+        self._production_memo: dict[tuple, Optional['UnitType']] = {}
+
+    def reset_turn(self) -> None:
+        """Forget decisions memoized during the previous turn."""
+        self._production_memo.clear()
+
+    def assess_situation(self, civ: 'Civilization', game_state: 'GameState',
+                         time_budget_ms: Optional[float] = None) -> StrategicAssessment:
         """Assess the current strategic situation.
 
+        Military and economic strength are always assessed. Threat and then
+        expansion potential refine the assessment while time remains, so a
+        tight budget still yields a usable answer.
+
         Args:
             civ: Civilization to assess for
             game_state: Current game state
+            time_budget_ms: Time allowed for refinements, or None for no limit
 
         Returns:
             Strategic assessment
         """
+        start = time.perf_counter()
+
+        def within_budget() -> bool:
+            return (time_budget_ms is None
+                    or (time.perf_counter() - start) * 1000 < time_budget_ms)
+
         military = self._assess_military(civ, game_state)
         economic = self._assess_economy(civ, game_state)
-        threat = self._assess_threats(civ, game_state)
-        expansion = self._assess_expansion(civ, game_state)
+
+        threat = UNASSESSED_THREAT
+        if within_budget():
+            threat = self._assess_threats(civ, game_state)
+
+        expansion = UNASSESSED_EXPANSION
+        if within_budget():
+            expansion = self._assess_expansion(civ, game_state)
 
         # Determine recommended goal based on situation and personality
         goal = self._determine_goal(military, economic, threat, expansion)
@@ -84,8 +126,9 @@ class StrategicAI:
         our_strength = sum(u.attack + u.defense for u in our_units)
 
         enemy_strength = 0
+        civ_id = civ.civ_id
         for enemy_civ in game_state.active_civs:
-            if enemy_civ != civ:
+            if enemy_civ.civ_id != civ_id:
                 enemy_units = game_state.get_units_for_civ(enemy_civ)
                 enemy_strength += sum(u.attack + u.defense for u in enemy_units)
 
@@ -129,21 +172,27 @@ class StrategicAI:
         if not our_cities:
             return 1.0  # No cities = max threat
 
+        city_xy = [(city.x, city.y) for city in our_cities]
         threat = 0.0
+        civ_id = civ.civ_id
 
         for enemy_civ in game_state.active_civs:
-            if enemy_civ == civ:
+            if enemy_civ.civ_id == civ_id:
                 continue
 
-            enemy_units = game_state.get_units_for_civ(enemy_civ)
-            for unit in enemy_units:
+            for unit in game_state.get_units_for_civ(enemy_civ):
                 # Check distance to our cities
-                for city in our_cities:
-                    dist = abs(unit.x - city.x) + abs(unit.y - city.y)
-                    if dist < 5:
-                        threat += (5 - dist) * 0.1
+                ux, uy = unit.x, unit.y
+                for cx, cy in city_xy:
+                    dist = abs(ux - cx) + abs(uy - cy)
+                    if dist < THREAT_RADIUS:
+                        threat += THREAT_BY_DISTANCE[dist]
+
+                # The result is capped at 1.0, so stop once it is reached
+                if threat >= 1.0:
+                    return 1.0
 
-        return min(1.0, threat)
+        return threat
 
     def _assess_expansion(self, civ: 'Civilization', game_state: 'GameState') -> float:
         """Assess potential for expansion.
@@ -182,10 +231,11 @@ class StrategicAI:
         Returns:
             Recommended strategic goal
         """
-        military_weight = self.personality_weights.get("military_weight", 1.0)
-        expansion_weight = self.personality_weights.get("expansion_weight", 1.0)
-        economy_weight = self.personality_weights.get("economy_weight", 1.0)
-        research_weight = self.personality_weights.get("research_weight", 1.0)
+        weights = self.personality_weights
+        military_weight = weights.military_weight
+        expansion_weight = weights.expansion_weight
+        economy_weight = weights.economy_weight
+        research_weight = weights.research_weight
 
         # High threat = defend or build military
         if threat > 0.6:
@@ -204,21 +254,51 @@ class StrategicAI:
         return max(scores, key=scores.get)
 
     def decide_production(self, city: 'City', civ: 'Civilization',
-                          game_state: 'GameState') -> None:
+                          game_state: 'GameState', use_memo: bool = True) -> None:
         """Decide what a city should produce.
 
+        Production utility depends only on the unit type, personality and
+        what the civ can research and afford, so cities sharing that state
+        within a turn reuse the first city's choice.
+
         Args:
             city: City to decide for
             civ: Owning civilization
             game_state: Current game state
+            use_memo: Reuse a choice memoized this turn
         """
         if city.is_producing:
             return  # Already producing something
 
-        available_units = get_available_units(civ.researched_techs)
-        if not available_units:
+        key = (civ.name, civ.tech_bits, tuple(civ.resources.items()))
+        if use_memo and key in self._production_memo:
+            best_unit = self._production_memo[key]
+            if best_unit:
+                city.set_production(best_unit)
             return
 
+        best_unit = self._choose_production(city, civ, game_state)
+        self._production_memo[key] = best_unit
+
+        if best_unit:
+            city.set_production(best_unit)
+
+    def _choose_production(self, city: 'City', civ: 'Civilization',
+                           game_state: 'GameState') -> Optional['UnitType']:
+        """Pick the unit type with the highest production utility.
+
+        Args:
+            city: City to decide for
+            civ: Owning civilization
+            game_state: Current game state
+
+        Returns:
+            Best unit type, or None if nothing is available
+        """
+        available_units = get_available_units_for_mask(civ.tech_bits)
+        if not available_units:
+            return None
+
         best_unit = None
         best_utility = -1
 
@@ -230,8 +310,7 @@ class StrategicAI:
                 best_utility = utility
                 best_unit = unit_type
 
-        if best_unit:
-            city.set_production(best_unit)
+        return best_unit
 
     def decide_research(self, civ: 'Civilization', game_state: 'GameState') -> None:
         """Decide what technology to research.
@@ -243,7 +322,7 @@ class StrategicAI:
         if civ.current_research:
             return  # Already researching
 
-        available_techs = get_available_techs(civ.researched_techs)
+        available_techs = get_available_techs_for_mask(civ.tech_bits)
         if not available_techs:
             return
 
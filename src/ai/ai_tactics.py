@@ -1,11 +1,17 @@
 """Tactical AI for unit-level decisions."""
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum, auto
 
 from src.map.pathfinding import find_path, get_reachable_tiles, get_tiles_in_attack_range
-from src.ai.utility_functions import calculate_attack_utility, calculate_movement_utility, calculate_retreat_utility
+from src.ai.utility_functions import (
+    as_personality_weights,
+    calculate_attack_utility_batch,
+    calculate_movement_utility,
+    calculate_retreat_utility,
+)
+from src.core.settings import PersonalityWeights
 from src.systems.combat_system import CombatSystem
 
 if TYPE_CHECKING:
@@ -14,6 +20,13 @@ if TYPE_CHECKING:
     from src.map.tile import Tile
 
 
+# Plies searched per decision: our action, then the best enemy reply
+SEARCH_DEPTH = 2
+
+# Extra penalty when an enemy reply is expected to kill the unit
+LETHAL_REPLY_PENALTY = 3.0
+
+
 class ActionType(Enum):
     """Types of tactical actions."""
     ATTACK = auto()
@@ -31,20 +44,69 @@ class TacticalAction:
     utility: float = 0.0
 
 
+class _SearchState(NamedTuple):
+    """A node of the tactical search: where the unit stands after an action."""
+    unit: 'Unit'
+    game_state: 'GameState'
+    tile: Optional['Tile']
+    score: float = 0.0
+    action: Optional[TacticalAction] = None
+    spared: Optional['Unit'] = None  # Enemy expected to die from our attack
+
+
 class TacticalAI:
     """Handles tactical decisions for individual units."""
 
-    def __init__(self, personality_weights: dict[str, float]):
+    def __init__(
+        self,
+        personality_weights: Union[dict[str, float], PersonalityWeights],
+        search_depth: int = SEARCH_DEPTH
+    ):
         """Initialize tactical AI.
 
         Args:
-            personality_weights: AI personality weights
+            personality_weights: AI personality weights, as a dict or PersonalityWeights
+            search_depth: Plies to search per decision (1 = no enemy lookahead)
+        """
+        self.personality_weights = as_personality_weights(personality_weights)
+        self.search_depth = search_depth
+
+        # Enemy unit positions for this turn, set by the controller
+        self.enemy_xy: Optional[list[tuple[int, int]]] = None
+
+        # Enemy replies keyed by (owner_id, unit_type, health, tile x, tile y):
+        # everything the expected damage depends on, so units of one type
+        # share entries across decisions. Cleared after every attack or move
+        self._transpositions: dict[tuple, list[tuple[float, 'Unit']]] = {}
+
+        # Pathfinding results keyed by (unit.id, x, y, remaining_movement),
+        # cleared whenever a unit moves or dies
+        self._reach_cache: dict[tuple, dict['Tile', float]] = {}
+        self._attack_range_cache: dict[tuple, list['Tile']] = {}
+
+        # Paths keyed by (unit.id, start x, start y, goal x, goal y), cleared
+        # whenever a unit moves or dies
+        self._path_cache: dict[tuple, list['Tile']] = {}
+
+    def reset_caches(self) -> None:
+        """Drop cached reachable tiles, attackable tiles, paths and enemy replies.
+
+        Called at the start of a turn and after every move or kill, since
+        occupancy changes which tiles can be entered and who can strike back.
+        Entries are therefore only reused between decisions that leave the
+        board unchanged, such as a unit fortifying or skipping its turn.
         """
-        self.personality_weights = personality_weights
+        self._transpositions.clear()
+        self._reach_cache.clear()
+        self._attack_range_cache.clear()
+        self._path_cache.clear()
 
     def decide_action(self, unit: 'Unit', game_state: 'GameState') -> TacticalAction:
         """Decide the best action for a unit.
 
+        Runs a depth-limited minimax search with alpha-beta pruning over our
+        candidate actions and the enemy replies they expose the unit to.
+
         Args:
             unit: Unit to decide for
             game_state: Current game state
@@ -52,6 +114,70 @@ class TacticalAI:
         Returns:
             Best tactical action
         """
+        root = _SearchState(unit, game_state, game_state.grid.get_tile(unit.x, unit.y))
+        _, action = self._alphabeta(root, self.search_depth, float('-inf'), float('inf'), True)
+
+        return action or TacticalAction(action_type=ActionType.FORTIFY)
+
+    def _alphabeta(
+        self,
+        state: _SearchState,
+        depth: int,
+        alpha: float,
+        beta: float,
+        maximizing: bool
+    ) -> tuple[float, Optional[TacticalAction]]:
+        """Search the action tree below a state with alpha-beta pruning.
+
+        Args:
+            state: Node to evaluate
+            depth: Remaining plies
+            alpha: Best score the maximizer is assured of
+            beta: Best score the minimizer is assured of
+            maximizing: True at our nodes, False at enemy reply nodes
+
+        Returns:
+            Tuple of (score, action leading to it)
+        """
+        # The unit commits to one action per decision, so nodes after a reply are leaves
+        if depth == 0 or (maximizing and state.action is not None):
+            return state.score, state.action
+
+        if maximizing:
+            best_score, best_action = float('-inf'), None
+            for child in self._expand_actions(state):
+                score, _ = self._alphabeta(child, depth - 1, alpha, beta, False)
+                if score > best_score:
+                    best_score, best_action = score, child.action
+                alpha = max(alpha, best_score)
+                if alpha >= beta:
+                    break
+            return best_score, best_action
+
+        best_score = state.score
+        for penalty, enemy in self._get_enemy_replies(state.unit, state.tile, state.game_state):
+            if enemy is state.spared:
+                continue
+            score, _ = self._alphabeta(
+                state._replace(score=state.score - penalty), depth - 1, alpha, beta, True
+            )
+            best_score = min(best_score, score)
+            beta = min(beta, best_score)
+            if alpha >= beta:
+                break
+        return best_score, state.action
+
+    def _expand_actions(self, state: _SearchState) -> list[_SearchState]:
+        """Generate our candidate actions as child states, best utility first.
+
+        Args:
+            state: Root state for the deciding unit
+
+        Returns:
+            Child states ordered by descending utility
+        """
+        unit = state.unit
+        game_state = state.game_state
         possible_actions = []
 
         # Check if should retreat
@@ -77,11 +203,73 @@ class TacticalAI:
             utility=0.1
         ))
 
-        # Select highest utility action
-        if not possible_actions:
-            return TacticalAction(action_type=ActionType.FORTIFY)
+        # Good moves first so the enemy replies to them set tight bounds early
+        possible_actions.sort(key=lambda a: a.utility, reverse=True)
+
+        children = []
+        for action in possible_actions:
+            tile = state.tile
+            spared = None
+            if action.action_type == ActionType.ATTACK:
+                damage_dealt, _ = CombatSystem.calculate_expected_damage(
+                    unit, action.target_unit, action.target_tile
+                )
+                if damage_dealt >= action.target_unit.health:
+                    spared = action.target_unit
+            elif action.target_tile is not None:
+                tile = action.target_tile
+            children.append(state._replace(
+                tile=tile, score=action.utility, action=action, spared=spared
+            ))
+
+        return children
 
-        return max(possible_actions, key=lambda a: a.utility)
+    def _get_enemy_replies(
+        self,
+        unit: 'Unit',
+        tile: Optional['Tile'],
+        game_state: 'GameState'
+    ) -> list[tuple[float, 'Unit']]:
+        """Get the penalty of each enemy attack the unit would face on a tile.
+
+        Args:
+            unit: Unit being evaluated
+            tile: Tile the unit would stand on
+            game_state: Current game state
+
+        Returns:
+            List of (penalty, enemy), most damaging first
+        """
+        if tile is None:
+            return []
+
+        key = (unit.owner_id, unit.unit_type, unit.health, tile.x, tile.y)
+        replies = self._transpositions.get(key)
+        if replies is not None:
+            return replies
+
+        replies = []
+        owner_id = unit.owner_id
+        for enemy in game_state.get_all_units():
+            if enemy.owner_id == owner_id or not enemy.is_alive:
+                continue
+            distance = abs(enemy.x - tile.x) + abs(enemy.y - tile.y)
+            if distance > enemy.movement + enemy.range:
+                continue
+
+            # Score the attack against the unit standing on tile; an enemy out
+            # of range first closes to its attack range
+            damage, _ = CombatSystem.calculate_expected_damage(
+                enemy, unit, tile, min(distance, enemy.range)
+            )
+            penalty = damage / unit.max_health
+            if damage >= unit.health:
+                penalty += LETHAL_REPLY_PENALTY
+            replies.append((penalty, enemy))
+
+        replies.sort(key=lambda r: r[0], reverse=True)
+        self._transpositions[key] = replies
+        return replies
 
     def _get_attack_actions(self, unit: 'Unit', game_state: 'GameState') -> list[TacticalAction]:
         """Get possible attack actions.
@@ -93,25 +281,32 @@ class TacticalAI:
         Returns:
             List of attack actions
         """
-        actions = []
-
         # Get tiles in attack range
-        attackable_tiles = get_tiles_in_attack_range(game_state.grid, unit)
-
-        for tile in attackable_tiles:
-            if tile.unit and tile.unit.owner != unit.owner:
-                # Enemy unit found
-                utility = calculate_attack_utility(
-                    unit, tile.unit, tile, self.personality_weights
-                )
-                actions.append(TacticalAction(
-                    action_type=ActionType.ATTACK,
-                    target_tile=tile,
-                    target_unit=tile.unit,
-                    utility=utility
-                ))
+        key = (unit.id, unit.x, unit.y)
+        attackable_tiles = self._attack_range_cache.get(key)
+        if attackable_tiles is None:
+            attackable_tiles = get_tiles_in_attack_range(game_state.grid, unit)
+            self._attack_range_cache[key] = attackable_tiles
+
+        owner_id = unit.owner_id
+        target_tiles = [
+            tile for tile in attackable_tiles
+            if tile.unit and tile.unit.owner_id != owner_id
+        ]
+        targets = [tile.unit for tile in target_tiles]
+        utilities = calculate_attack_utility_batch(
+            unit, targets, target_tiles, self.personality_weights
+        )
 
-        return actions
+        return [
+            TacticalAction(
+                action_type=ActionType.ATTACK,
+                target_tile=tile,
+                target_unit=target,
+                utility=utility
+            )
+            for tile, target, utility in zip(target_tiles, targets, utilities)
+        ]
 
     def _get_move_actions(self, unit: 'Unit', game_state: 'GameState') -> list[TacticalAction]:
         """Get possible movement actions.
@@ -129,16 +324,14 @@ class TacticalAI:
         if not start_tile:
             return actions
 
-        reachable = get_reachable_tiles(
-            game_state.grid, start_tile, unit.remaining_movement, unit
-        )
+        reachable = self._get_reachable(unit, start_tile, game_state)
 
         for tile, cost in reachable.items():
             if tile.has_unit():
                 continue  # Can't move onto occupied tile
 
             utility = calculate_movement_utility(
-                unit, tile, game_state, self.personality_weights
+                unit, tile, game_state, self.personality_weights, self.enemy_xy
             )
             actions.append(TacticalAction(
                 action_type=ActionType.MOVE,
@@ -148,6 +341,56 @@ class TacticalAI:
 
         return actions
 
+    def _get_reachable(
+        self,
+        unit: 'Unit',
+        start_tile: 'Tile',
+        game_state: 'GameState'
+    ) -> dict['Tile', float]:
+        """Get tiles the unit can reach this turn, cached until any unit moves.
+
+        Args:
+            unit: Moving unit
+            start_tile: Tile the unit stands on
+            game_state: Current game state
+
+        Returns:
+            Dict mapping reachable tiles to movement cost
+        """
+        key = (unit.id, unit.x, unit.y, unit.remaining_movement)
+        reachable = self._reach_cache.get(key)
+        if reachable is None:
+            reachable = get_reachable_tiles(
+                game_state.grid, start_tile, unit.remaining_movement, unit
+            )
+            self._reach_cache[key] = reachable
+        return reachable
+
+    def _get_path(
+        self,
+        unit: 'Unit',
+        start_tile: 'Tile',
+        goal_tile: 'Tile',
+        game_state: 'GameState'
+    ) -> list['Tile']:
+        """Get a path for the unit, cached until any unit moves or dies.
+
+        Args:
+            unit: Moving unit
+            start_tile: Tile the unit stands on
+            goal_tile: Destination tile
+            game_state: Current game state
+
+        Returns:
+            Path from start to goal, or empty list if none
+        """
+        key = (unit.id, start_tile.x, start_tile.y, goal_tile.x, goal_tile.y)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = find_path(game_state.grid, start_tile, goal_tile, unit)
+            self._path_cache[key] = path
+        return path
+
     def _get_retreat_action(self, unit: 'Unit', game_state: 'GameState') -> Optional[TacticalAction]:
         """Get retreat action toward nearest friendly city.
 
@@ -177,14 +420,12 @@ class TacticalAI:
             return None
 
         # Find path to city
-        path = find_path(game_state.grid, unit_tile, city_tile, unit)
+        path = self._get_path(unit, unit_tile, city_tile, game_state)
         if not path:
             return None
 
         # Move as far as we can toward city
-        reachable = get_reachable_tiles(
-            game_state.grid, unit_tile, unit.remaining_movement, unit
-        )
+        reachable = self._get_reachable(unit, unit_tile, game_state)
 
         best_tile = None
         best_distance = float('inf')
@@ -255,6 +496,12 @@ class TacticalAI:
         if result.attacker_killed:
             game_state.remove_unit(unit)
 
+        if result.defender_killed or result.attacker_killed:
+            self.reset_caches()
+        else:
+            # The target's health changed, and with it the damage it replies with
+            self._transpositions.clear()
+
         return True
 
     def _execute_move(self, action: TacticalAction, unit: 'Unit', game_state: 'GameState') -> bool:
@@ -272,4 +519,7 @@ class TacticalAI:
             return False
 
         cost = action.target_tile.movement_cost
-        return game_state.move_unit(unit, action.target_tile.x, action.target_tile.y, int(cost))
+        moved = game_state.move_unit(unit, action.target_tile.x, action.target_tile.y, int(cost))
+        if moved:
+            self.reset_caches()
+        return moved
@@ -1,7 +1,9 @@
 """Utility calculation functions for AI decision making."""
 
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union
 
+from src.core.settings import PersonalityWeights
 from src.systems.combat_system import CombatSystem
 
 if TYPE_CHECKING:
@@ -12,11 +14,34 @@ if TYPE_CHECKING:
     from src.map.tile import Tile
 
 
+def as_personality_weights(
+    personality_weights: Union[dict[str, float], PersonalityWeights]
+) -> PersonalityWeights:
+    """Normalize personality weights to a PersonalityWeights record.
+
+    Args:
+        personality_weights: Weights dict (as in AI_PERSONALITIES) or record
+
+    Returns:
+        PersonalityWeights, the argument itself if it already is one
+    """
+    if isinstance(personality_weights, PersonalityWeights):
+        return personality_weights
+    return PersonalityWeights._make(
+        personality_weights.get(name, 1.0) for name in PersonalityWeights._fields
+    )
+
+
+# Attack utilities keyed by the primitives they depend on; cleared when full
+ATTACK_UTILITY_CACHE_SIZE = 4096
+_attack_utility_cache: dict[tuple, float] = {}
+
+
 def calculate_attack_utility(
     attacker: 'Unit',
     defender: 'Unit',
     defender_tile: 'Tile',
-    personality_weights: dict[str, float]
+    personality_weights: Union[dict[str, float], PersonalityWeights]
 ) -> float:
     """Calculate utility of attacking a target.
 
@@ -26,6 +51,73 @@ def calculate_attack_utility(
         defender_tile: Tile defender is on
         personality_weights: AI personality weights
 
+    Returns:
+        Utility score (higher = better attack)
+    """
+    military_weight = as_personality_weights(personality_weights).military_weight
+    key = _attack_utility_key(attacker, defender, defender_tile, military_weight)
+    utility = _attack_utility_cache.get(key)
+    if utility is None:
+        utility = _compute_attack_utility(attacker, defender, defender_tile, military_weight)
+        _store_attack_utility(key, utility)
+
+    return utility
+
+
+def _attack_utility_key(
+    attacker: 'Unit',
+    defender: 'Unit',
+    defender_tile: 'Tile',
+    military_weight: float
+) -> tuple:
+    """Build the attack utility cache key.
+
+    Stats come from the unit type, so these primitives fully determine the
+    result.
+
+    Args:
+        attacker: Attacking unit
+        defender: Target unit
+        defender_tile: Tile defender is on
+        military_weight: Personality military weight
+
+    Returns:
+        Hashable cache key
+    """
+    distance = abs(attacker.x - defender.x) + abs(attacker.y - defender.y)
+    return (
+        attacker.unit_type, attacker.health,
+        defender.unit_type, defender.health,
+        distance, defender_tile.terrain, military_weight,
+    )
+
+
+def _store_attack_utility(key: tuple, utility: float) -> None:
+    """Store an attack utility, clearing the cache first if it is full.
+
+    Args:
+        key: Key from _attack_utility_key
+        utility: Utility score to cache
+    """
+    if len(_attack_utility_cache) >= ATTACK_UTILITY_CACHE_SIZE:
+        _attack_utility_cache.clear()
+    _attack_utility_cache[key] = utility
+
+
+def _compute_attack_utility(
+    attacker: 'Unit',
+    defender: 'Unit',
+    defender_tile: 'Tile',
+    military_weight: float
+) -> float:
+    """Compute attack utility without caching.
+
+    Args:
+        attacker: Attacking unit
+        defender: Target unit
+        defender_tile: Tile defender is on
+        military_weight: Personality military weight
+
     Returns:
         Utility score (higher = better attack)
     """
@@ -33,7 +125,28 @@ def calculate_attack_utility(
     damage_dealt, damage_received = CombatSystem.calculate_expected_damage(
         attacker, defender, defender_tile
     )
+    return _score_attack(damage_dealt, damage_received, defender, attacker.health, military_weight)
 
+
+def _score_attack(
+    damage_dealt: int,
+    damage_received: int,
+    defender: 'Unit',
+    attacker_health: int,
+    military_weight: float
+) -> float:
+    """Score an attack from its expected damage exchange.
+
+    Args:
+        damage_dealt: Expected damage to the defender
+        damage_received: Expected counterattack damage
+        defender: Target unit
+        attacker_health: Attacker's current health
+        military_weight: Personality military weight
+
+    Returns:
+        Utility score (higher = better attack)
+    """
     # Base utility from damage ratio
     if damage_received == 0:
         damage_ratio = 10.0  # Very favorable
@@ -50,22 +163,82 @@ def calculate_attack_utility(
 
     # Risk penalty if we might die
     risk_penalty = 0.0
-    if damage_received >= attacker.health:
+    if damage_received >= attacker_health:
         risk_penalty = -3.0
 
     # Apply personality weight
-    military_weight = personality_weights.get("military_weight", 1.0)
-
     utility = (damage_ratio + target_value + kill_bonus + risk_penalty) * military_weight
 
     return max(0.0, utility)
 
 
+def calculate_attack_utility_batch(
+    attacker: 'Unit',
+    defenders: list['Unit'],
+    defender_tiles: list['Tile'],
+    personality_weights: Union[dict[str, float], PersonalityWeights]
+) -> list[float]:
+    """Calculate attack utility against several targets at once.
+
+    Equivalent to calling calculate_attack_utility per target and sharing
+    its cache; targets missing from the cache are scored together, with the
+    attacker's values hoisted out through CombatSystem.calculate_odds_matrix.
+
+    Args:
+        attacker: Attacking unit
+        defenders: Target units
+        defender_tiles: Tile each defender is on, parallel to defenders
+        personality_weights: AI personality weights
+
+    Returns:
+        Utility score per defender
+    """
+    if not defenders:
+        return []
+
+    military_weight = as_personality_weights(personality_weights).military_weight
+    keys = [
+        _attack_utility_key(attacker, defender, tile, military_weight)
+        for defender, tile in zip(defenders, defender_tiles)
+    ]
+    utilities = [_attack_utility_cache.get(key) for key in keys]
+
+    misses = [i for i, utility in enumerate(utilities) if utility is None]
+    if misses:
+        attacker_health = attacker.health
+        expected = CombatSystem.calculate_odds_matrix(
+            [attacker], [defenders[i] for i in misses], [defender_tiles[i] for i in misses]
+        )[0]
+        for i, (damage_dealt, damage_received) in zip(misses, expected):
+            utility = _score_attack(
+                damage_dealt, damage_received, defenders[i], attacker_health, military_weight
+            )
+            _store_attack_utility(keys[i], utility)
+            utilities[i] = utility
+
+    return utilities
+
+
+def get_enemy_positions(civ: 'Civilization', game_state: 'GameState') -> list[tuple[int, int]]:
+    """Snapshot the positions of every unit not owned by a civilization.
+
+    Args:
+        civ: Civilization whose enemies to collect
+        game_state: Current game state
+
+    Returns:
+        List of (x, y) enemy unit positions
+    """
+    civ_id = civ.civ_id
+    return [(u.x, u.y) for u in game_state.get_all_units() if u.owner_id != civ_id]
+
+
 def calculate_movement_utility(
     unit: 'Unit',
     target_tile: 'Tile',
     game_state: 'GameState',
-    personality_weights: dict[str, float]
+    personality_weights: Union[dict[str, float], PersonalityWeights],
+    enemy_xy: Optional[list[tuple[int, int]]] = None
 ) -> float:
     """Calculate utility of moving to a target tile.
 
@@ -74,40 +247,40 @@ def calculate_movement_utility(
         target_tile: Destination tile
         game_state: Current game state
         personality_weights: AI personality weights
+        enemy_xy: Enemy unit positions from get_enemy_positions, scanned
+            from game_state when omitted
 
     Returns:
         Utility score (higher = better move)
     """
+    weights = as_personality_weights(personality_weights)
     utility = 0.0
 
+    tx, ty = target_tile.x, target_tile.y
+
     # Distance to enemy units (closer = higher utility for aggressive)
-    enemy_units = [u for u in game_state.get_all_units() if u.owner != unit.owner]
-    if enemy_units:
-        min_enemy_dist = min(
-            abs(target_tile.x - e.x) + abs(target_tile.y - e.y)
-            for e in enemy_units
-        )
+    if enemy_xy is None:
+        enemy_xy = get_enemy_positions(unit.owner, game_state)
+    if enemy_xy:
+        min_enemy_dist = min(abs(tx - ex) + abs(ty - ey) for ex, ey in enemy_xy)
         # Aggressive AI wants to be closer, balanced less so
-        military_weight = personality_weights.get("military_weight", 1.0)
-        utility += (10 - min_enemy_dist) * 0.1 * military_weight
+        utility += (10 - min_enemy_dist) * 0.1 * weights.military_weight
 
     # Distance to enemy cities
-    enemy_cities = [c for c in game_state.get_all_cities() if c.owner != unit.owner]
-    if enemy_cities:
-        min_city_dist = min(
-            abs(target_tile.x - c.x) + abs(target_tile.y - c.y)
-            for c in enemy_cities
-        )
-        expansion_weight = personality_weights.get("expansion_weight", 1.0)
-        utility += (10 - min_city_dist) * 0.15 * expansion_weight
+    owner_id = unit.owner_id
+    enemy_city_xy = [
+        (c.x, c.y) for c in game_state.get_all_cities() if c.owner.civ_id != owner_id
+    ]
+    if enemy_city_xy:
+        min_city_dist = min(abs(tx - cx) + abs(ty - cy) for cx, cy in enemy_city_xy)
+        utility += (10 - min_city_dist) * 0.15 * weights.expansion_weight
 
     # Terrain defense bonus
     utility += target_tile.defense_bonus * 0.5
 
     # Resource proximity
     if target_tile.resource:
-        economy_weight = personality_weights.get("economy_weight", 1.0)
-        utility += 0.3 * economy_weight
+        utility += 0.3 * weights.economy_weight
 
     return utility
 
@@ -141,7 +314,7 @@ def calculate_production_utility(
     unit_type,
     game_state: 'GameState',
     civ: 'Civilization',
-    personality_weights: dict[str, float]
+    personality_weights: Union[dict[str, float], PersonalityWeights]
 ) -> float:
     """Calculate utility of producing a unit type.
 
@@ -157,6 +330,7 @@ def calculate_production_utility(
     """
     from src.data.unit_data import get_unit_stats, CombatType
 
+    weights = as_personality_weights(personality_weights)
     stats = get_unit_stats(unit_type)
     utility = 0.0
 
@@ -165,8 +339,7 @@ def calculate_production_utility(
     utility += combat_power
 
     # Weight by personality
-    military_weight = personality_weights.get("military_weight", 1.0)
-    utility *= military_weight
+    utility *= weights.military_weight
 
     # Ranged units slightly preferred for safety
     if stats.combat_type == CombatType.RANGED:
@@ -174,8 +347,7 @@ def calculate_production_utility(
 
     # Mobile units preferred for expansion
     if stats.movement >= 3:
-        expansion_weight = personality_weights.get("expansion_weight", 1.0)
-        utility += 0.3 * expansion_weight
+        utility += 0.3 * weights.expansion_weight
 
     # Can we afford it?
     if not civ.can_afford(stats.cost):
@@ -187,7 +359,7 @@ def calculate_production_utility(
 def calculate_research_utility(
     tech_id: str,
     civ: 'Civilization',
-    personality_weights: dict[str, float]
+    personality_weights: Union[dict[str, float], PersonalityWeights]
 ) -> float:
     """Calculate utility of researching a technology.
 
@@ -196,6 +368,30 @@ def calculate_research_utility(
         civ: Civilization researching
         personality_weights: AI personality weights
 
+    Returns:
+        Utility score
+    """
+    weights = as_personality_weights(personality_weights)
+    return _research_utility(
+        tech_id, weights.military_weight, weights.research_weight, weights.economy_weight
+    )
+
+
+@lru_cache(maxsize=256)
+def _research_utility(
+    tech_id: str,
+    military_weight: float,
+    research_weight: float,
+    economy_weight: float
+) -> float:
+    """Compute research utility from the tech and personality weights.
+
+    Args:
+        tech_id: Technology ID
+        military_weight: Personality military weight
+        research_weight: Personality research weight
+        economy_weight: Personality economy weight
+
     Returns:
         Utility score
     """
@@ -209,7 +405,6 @@ def calculate_research_utility(
 
     # Units unlocked are valuable
     if tech.unlocks_units:
-        military_weight = personality_weights.get("military_weight", 1.0)
         utility += len(tech.unlocks_units) * 2.0 * military_weight
 
     # Bonuses are valuable
@@ -217,10 +412,8 @@ def calculate_research_utility(
         if "production" in bonus_name:
             utility += bonus_value * 3.0
         elif "research" in bonus_name:
-            research_weight = personality_weights.get("research_weight", 1.0)
             utility += bonus_value * 4.0 * research_weight
         elif "food" in bonus_name or "economy" in bonus_name:
-            economy_weight = personality_weights.get("economy_weight", 1.0)
             utility += bonus_value * 2.0 * economy_weight
 
     # Cheaper techs are slightly preferred
@@ -0,0 +1,171 @@
+"""Fog of war state for a single civilization."""
+
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from src.core.settings import FOG_EXPLORED, FOG_VISIBLE
+
+_FOG_VISIBLE_BYTE = bytes((FOG_VISIBLE,))
+_FOG_EXPLORED_BYTE = bytes((FOG_EXPLORED,))
+
+# State name per FOG_* code; unexplored tiles have none
+_FOG_NAMES: tuple[Optional[str], ...] = tuple(
+    {FOG_EXPLORED: "EXPLORED", FOG_VISIBLE: "VISIBLE"}.get(code)
+    for code in range(max(FOG_EXPLORED, FOG_VISIBLE) + 1)
+)
+
+
+@dataclass
+class FogState:
+    """Visible and explored tiles as bitsets over row-major tile indices.
+
+    Bit y * width + x of visible/explored is set when that tile is currently
+    seen/has been seen. The same fog is mirrored into cells, a byte grid of
+    FOG_* values, for the renderer's per-frame lookups.
+
+    Lookups by (x, y) return "VISIBLE", "EXPLORED" or nothing, matching the
+    per-tile dict this replaces.
+    """
+
+    width: int
+    height: int
+    visible: int = 0
+    explored: int = 0
+    cells: bytearray = field(init=False, repr=False)
+
+    # Sight sources (x, y, radius) last applied by update, or None once the
+    # fog has been changed any other way
+    _sources: Optional[list[tuple[int, int, int]]] = field(
+        default=None, init=False, repr=False
+    )
+
+    # Sight stamp per (x, y, radius): (bitmask, ((start, end, run), ...))
+    _stamps: dict[tuple[int, int, int], tuple[int, tuple[tuple[int, int, bytes], ...]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        """Allocate the byte grid, mirroring any initial bitsets into it."""
+        self.cells = bytearray(self.width * self.height)
+        for bits, code in ((self.explored, FOG_EXPLORED), (self.visible, FOG_VISIBLE)):
+            while bits:
+                low = bits & -bits
+                self.cells[low.bit_length() - 1] = code
+                bits ^= low
+
+    def update(self, sources: list[tuple[int, int, int]]) -> None:
+        """Make exactly the tiles seen from sources visible.
+
+        Equivalent to begin_update followed by a reveal per source, but
+        skipped when the sources match the previous update's, since the
+        rebuild would reproduce the current fog.
+
+        Args:
+            sources: (x, y, radius) of every unit and city that sees
+        """
+        if sources == self._sources:
+            return
+        self.begin_update()
+        for x, y, radius in sources:
+            self.reveal(x, y, radius)
+        self._sources = sources
+
+    def begin_update(self) -> None:
+        """Demote every visible tile to explored before re-revealing."""
+        self._sources = None
+        self.explored |= self.visible
+        self.visible = 0
+        self.cells[:] = self.cells.replace(_FOG_VISIBLE_BYTE, _FOG_EXPLORED_BYTE)
+
+    def reveal(self, x: int, y: int, radius: int) -> None:
+        """Mark tiles within Manhattan distance radius of (x, y) visible.
+
+        Args:
+            x: Center X coordinate
+            y: Center Y coordinate
+            radius: Sight radius
+        """
+        mask, spans = self._stamp(x, y, radius)
+        self._sources = None
+        self.visible |= mask
+        cells = self.cells
+        for start, end, run in spans:
+            cells[start:end] = run
+
+    def _stamp(self, x: int, y: int, radius: int) -> tuple[int, tuple[tuple[int, int, bytes], ...]]:
+        """Get the clipped sight diamond centered on a tile.
+
+        Args:
+            x: Center X coordinate
+            y: Center Y coordinate
+            radius: Sight radius
+
+        Returns:
+            Bitmask of covered tiles and the (start, end, fill) row spans
+        """
+        key = (x, y, radius)
+        stamp = self._stamps.get(key)
+        if stamp is not None:
+            return stamp
+
+        width = self.width
+        mask = 0
+        spans = []
+        for row in range(max(0, y - radius), min(self.height, y + radius + 1)):
+            half = radius - abs(row - y)
+            x0 = max(0, x - half)
+            x1 = min(width, x + half + 1)
+            if x0 >= x1:
+                continue
+            start = row * width + x0
+            end = row * width + x1
+            mask |= ((1 << (x1 - x0)) - 1) << start
+            spans.append((start, end, _FOG_VISIBLE_BYTE * (x1 - x0)))
+
+        stamp = self._stamps[key] = (mask, tuple(spans))
+        return stamp
+
+    def get(self, pos: tuple[int, int], default: Optional[str] = None) -> Optional[str]:
+        """Get the fog state of a tile.
+
+        Args:
+            pos: (x, y) position
+            default: Value returned for unexplored tiles
+
+        Returns:
+            "VISIBLE", "EXPLORED", or default
+        """
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return default
+        # Read the byte grid: testing a bit of the bitsets costs time
+        # proportional to the map size
+        state = _FOG_NAMES[self.cells[y * self.width + x]]
+        return default if state is None else state
+
+    def __getitem__(self, pos: tuple[int, int]) -> str:
+        """Get the fog state of a seen tile, raising KeyError if unexplored."""
+        state = self.get(pos)
+        if state is None:
+            raise KeyError(pos)
+        return state
+
+    def __contains__(self, pos: object) -> bool:
+        """Check whether a tile has ever been seen."""
+        return isinstance(pos, tuple) and self.get(pos) is not None
+
+    def items(self) -> Iterator[tuple[tuple[int, int], str]]:
+        """Iterate over seen tiles and their fog states in row-major order.
+
+        Yields:
+            ((x, y), state) pairs
+        """
+        seen = self.visible | self.explored
+        width = self.width
+        while seen:
+            low = seen & -seen
+            index = low.bit_length() - 1
+            yield (index % width, index // width), (
+                "VISIBLE" if self.visible & low else "EXPLORED"
+            )
+            seen ^= low
@@ -5,7 +5,7 @@ from typing import Optional
 
 from src.core.settings import (
     WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, FPS,
-    MAP_WIDTH, MAP_HEIGHT, COLORS
+    MAP_WIDTH, MAP_HEIGHT, COLORS, FOG_VISIBLE
 )
 from src.core.game_state import GameState, GamePhase
 from src.map.grid import Grid
@@ -89,10 +89,6 @@ class Game:
         )
         self.game_state.phase = GamePhase.PLAYING
 
-        # Initialize fog states for all civs
-        for civ in civs:
-            self.game_state.fog_states[civ.name] = {}
-
         # Create starting units and cities
         for i, (civ, (start_x, start_y)) in enumerate(zip(civs, starting_positions)):
             # Create capital city
@@ -154,7 +150,10 @@ class Game:
 
     def _handle_events(self) -> None:
         """Handle pygame events."""
-        events = self.input_handler.process_events(self.game_state)
+        # Block briefly for input when the view isn't changing
+        events = self.input_handler.process_events(
+            self.game_state, idle=not self.input_handler.scrolling
+        )
 
         for event in events:
             if event.action == InputAction.QUIT:
@@ -185,7 +184,7 @@ class Game:
         Args:
             event: Input event
         """
-        if "unit" in event.data:
+        if event.data and "unit" in event.data:
             unit = event.data["unit"]
             self.game_state.selected_unit = unit
             self._update_movement_preview()
@@ -224,7 +223,7 @@ class Game:
             event: Input event
         """
         attacker = self.game_state.selected_unit
-        target = event.data.get("target")
+        target = event.data.get("target") if event.data else None
 
         if not attacker or not target or not attacker.can_attack:
             return
@@ -313,23 +312,24 @@ class Game:
         """Render the game."""
         self.renderer.clear()
 
-        # Get player's fog state
-        fog_state = self.game_state.get_player_fog_state()
+        # Get player's fog grid
+        fog_grid = self.game_state.get_player_fog_grid()
+        width = self.game_state.grid.width
 
         # Render map
-        self.renderer.render_grid(self.game_state.grid, self.camera, fog_state)
+        self.renderer.render_grid(self.game_state.grid, self.camera, fog_grid)
 
         # Render movement preview
         self._render_movement_preview()
 
         # Render cities (only visible ones)
         for city in self.game_state.get_all_cities():
-            if fog_state.get((city.x, city.y)) == "VISIBLE":
+            if fog_grid[city.y * width + city.x] == FOG_VISIBLE:
                 self.renderer.render_city(city, self.camera)
 
         # Render units (only visible ones)
         for unit in self.game_state.get_all_units():
-            if fog_state.get((unit.x, unit.y)) == "VISIBLE":
+            if fog_grid[unit.y * width + unit.x] == FOG_VISIBLE:
                 selected = unit == self.game_state.selected_unit
                 self.renderer.render_unit(unit, self.camera, selected)
 
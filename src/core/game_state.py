@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum, auto
 
+from src.core.fog import FogState
+from src.core.settings import UNIT_VISION_RANGE
 from src.map.grid import Grid
 from src.entities.civilization import Civilization
 from src.entities.unit import Unit
@@ -45,12 +47,16 @@ class GameState:
     selected_unit_id: Optional[str] = None
 
     # Fog of war per civilization
-    fog_states: dict[str, dict[tuple[int, int], str]] = field(default_factory=dict)
+    fog_states: dict[str, FogState] = field(default_factory=dict)
 
     def __post_init__(self):
         """Initialize fog states for each civ."""
         for civ in self.civilizations:
-            self.fog_states[civ.name] = {}
+            self.fog_states[civ.name] = self._new_fog_state()
+
+    def _new_fog_state(self) -> FogState:
+        """Create an all-unexplored fog state sized to the grid."""
+        return FogState(self.grid.width, self.grid.height)
 
     @property
     def current_player(self) -> Civilization:
@@ -259,17 +265,15 @@ class GameState:
         Returns:
             Winning civilization or None
         """
+        # Update elimination status (O(1) per civ) while collecting survivors
+        active = [civ for civ in self.civilizations if not civ.check_elimination()]
+
         # Check for elimination victory (only one civ left)
-        active = self.active_civs
         if len(active) == 1:
             self.winner = active[0]
             self.phase = GamePhase.GAME_OVER
             return self.winner
 
-        # Update elimination status for each civ
-        for civ in self.civilizations:
-            civ.check_elimination()
-
         return None
 
     # Fog of war
@@ -284,9 +288,10 @@ class GameState:
         Returns:
             "UNEXPLORED", "EXPLORED", or "VISIBLE"
         """
-        if civ.name not in self.fog_states:
+        fog = self.fog_states.get(civ.name)
+        if fog is None:
             return "UNEXPLORED"
-        return self.fog_states[civ.name].get((x, y), "UNEXPLORED")
+        return fog.get((x, y), "UNEXPLORED")
 
     def update_visibility(self, civ: Civilization) -> None:
         """Update fog of war visibility for a civilization.
@@ -294,28 +299,43 @@ class GameState:
         Args:
             civ: Civilization to update visibility for
         """
-        if civ.name not in self.fog_states:
-            self.fog_states[civ.name] = {}
+        # Units and cities that see, in reveal order; the fog is only rebuilt
+        # when one of them was added, removed, moved or changed its range
+        sources = [(unit.x, unit.y, UNIT_VISION_RANGE) for unit in self.get_units_for_civ(civ)]
+        sources.extend(
+            (city.x, city.y, city.vision_range) for city in self.get_cities_for_civ(civ)
+        )
+        self.get_civ_fog(civ).update(sources)
 
-        fog = self.fog_states[civ.name]
+    def get_civ_fog(self, civ: Civilization) -> FogState:
+        """Get the fog state for a civilization, creating it if needed.
 
-        # Mark all previously visible tiles as explored
-        for pos, state in fog.items():
-            if state == "VISIBLE":
-                fog[pos] = "EXPLORED"
+        Args:
+            civ: Civilization to get fog for
 
-        # Update visibility from units
-        for unit in self.get_units_for_civ(civ):
-            visible_tiles = self.grid.get_tiles_in_range(unit.x, unit.y, 2)  # Unit vision = 2
-            for tile in visible_tiles:
-                fog[(tile.x, tile.y)] = "VISIBLE"
+        Returns:
+            The civilization's fog state
+        """
+        fog = self.fog_states.get(civ.name)
+        if not isinstance(fog, FogState):
+            fog = self.fog_states[civ.name] = self._new_fog_state()
+        return fog
 
-        # Update visibility from cities
-        for city in self.get_cities_for_civ(civ):
-            visible_tiles = self.grid.get_tiles_in_range(city.x, city.y, city.vision_range)
-            for tile in visible_tiles:
-                fog[(tile.x, tile.y)] = "VISIBLE"
+    def get_fog_grid(self, civ: Civilization) -> bytearray:
+        """Get the fog byte grid for a civilization, creating it if needed.
 
-    def get_player_fog_state(self) -> dict[tuple[int, int], str]:
+        Args:
+            civ: Civilization to get fog for
+
+        Returns:
+            Row-major bytearray of FOG_* values, indexed by y * width + x
+        """
+        return self.get_civ_fog(civ).cells
+
+    def get_player_fog_state(self) -> FogState:
         """Get fog state for the player civilization."""
-        return self.fog_states.get(self.player_civ.name, {})
+        return self.get_civ_fog(self.player_civ)
+
+    def get_player_fog_grid(self) -> bytearray:
+        """Get the fog byte grid for the player civilization."""
+        return self.get_fog_grid(self.player_civ)
@@ -1,5 +1,7 @@
 """Game constants and configuration."""
 
+from typing import NamedTuple
+
 # Window settings
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
@@ -81,6 +83,11 @@ STARTING_RESOURCES = {
 UNIT_VISION_RANGE = 2
 CITY_VISION_RANGE = 3
 
+# Fog of war states stored in per-civ byte grids
+FOG_UNEXPLORED = 0
+FOG_EXPLORED = 1
+FOG_VISIBLE = 2
+
 # AI personalities
 AI_PERSONALITIES = {
     "AGGRESSIVE": {
@@ -97,6 +104,22 @@ AI_PERSONALITIES = {
     },
 }
 
+
+class PersonalityWeights(NamedTuple):
+    """AI personality weights as a fixed record (missing keys default to 1.0)."""
+    military_weight: float = 1.0
+    expansion_weight: float = 1.0
+    economy_weight: float = 1.0
+    research_weight: float = 1.0
+
+
+AI_PERSONALITY_WEIGHTS = {
+    name: PersonalityWeights(**weights) for name, weights in AI_PERSONALITIES.items()
+}
+
 # Camera settings
 CAMERA_SCROLL_SPEED = 10
 CAMERA_EDGE_SCROLL_MARGIN = 50
+
+# Input settings
+INPUT_IDLE_WAIT_MS = 100  # Max time to block for events when nothing is changing
@@ -1,12 +1,13 @@
 """Technology definitions."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
-from src.data.unit_data import UnitType
+from src.data.unit_data import UNIT_STATS, UnitType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Technology:
     """Definition of a technology."""
     id: str
@@ -131,6 +132,48 @@ TECHNOLOGIES: dict[str, Technology] = {
 }
 
 
+# Bit position of each technology in a researched-tech mask
+TECH_INDEX: dict[str, int] = {tech_id: index for index, tech_id in enumerate(TECHNOLOGIES)}
+
+# TECHNOLOGIES is kept in topological order, so prerequisites have lower bits
+# and availability lists read from roots to later techs
+assert all(
+    TECH_INDEX[prereq] < TECH_INDEX[tech.id]
+    for tech in TECHNOLOGIES.values()
+    for prereq in tech.prerequisites
+), "Technologies must be listed after their prerequisites"
+
+
+def tech_mask(tech_ids) -> int:
+    """Pack technology IDs into a bitmask over TECH_INDEX.
+
+    Args:
+        tech_ids: Iterable of technology IDs (unknown IDs are ignored)
+
+    Returns:
+        Bitmask with the bit of each known tech set
+    """
+    mask = 0
+    for tech_id in tech_ids:
+        index = TECH_INDEX.get(tech_id)
+        if index is not None:
+            mask |= 1 << index
+    return mask
+
+
+# Per-tech bit and prerequisite mask, parallel to TECHNOLOGIES
+_TECH_MASKS: tuple[tuple[Technology, int, int], ...] = tuple(
+    (tech, 1 << TECH_INDEX[tech.id], tech_mask(tech.prerequisites))
+    for tech in TECHNOLOGIES.values()
+)
+
+
+# (bit, prerequisite mask) of each technology by ID
+_TECH_BITS: dict[str, tuple[int, int]] = {
+    tech.id: (bit, prereq_mask) for tech, bit, prereq_mask in _TECH_MASKS
+}
+
+
 def get_technology(tech_id: str) -> Optional[Technology]:
     """Get a technology by ID.
 
@@ -152,17 +195,125 @@ def get_available_techs(researched: set[str]) -> list[Technology]:
     Returns:
         List of researchable technologies
     """
-    available = []
-    for tech in TECHNOLOGIES.values():
-        # Skip already researched
-        if tech.id in researched:
-            continue
+    return get_available_techs_for_mask(tech_mask(researched))
+
+
+def get_available_techs_for_mask(researched_mask: int) -> list[Technology]:
+    """Get technologies that can be researched, given a researched-tech mask.
+
+    Args:
+        researched_mask: Bitmask of researched techs (see tech_mask)
+
+    Returns:
+        List of researchable technologies
+    """
+    return list(_available_techs(researched_mask))
+
 
-        # Check prerequisites
-        if all(prereq in researched for prereq in tech.prerequisites):
-            available.append(tech)
+@lru_cache(maxsize=256)
+def _available_techs(researched_mask: int) -> tuple[Technology, ...]:
+    """Get researchable technologies for a mask, memoized since the tech table is fixed.
+
+    Args:
+        researched_mask: Bitmask of researched techs (see tech_mask)
+
+    Returns:
+        Researchable technologies in TECHNOLOGIES order
+    """
+    return tuple(
+        tech for tech, bit, prereq_mask in _TECH_MASKS
+        # Not yet researched, and every prerequisite is
+        if not researched_mask & bit and researched_mask & prereq_mask == prereq_mask
+    )
+
+
+def can_research_for_mask(tech_id: str, researched_mask: int) -> bool:
+    """Check if a technology can be researched, given a researched-tech mask.
+
+    Args:
+        tech_id: Technology ID
+        researched_mask: Bitmask of researched techs (see tech_mask)
 
-    return available
+    Returns:
+        True if the tech exists, is not researched and has all prerequisites
+    """
+    bits = _TECH_BITS.get(tech_id)
+    if bits is None:
+        return False
+    bit, prereq_mask = bits
+    return not researched_mask & bit and researched_mask & prereq_mask == prereq_mask
+
+
+def get_bonus_for_mask(bonus_name: str, researched_mask: int) -> float:
+    """Get the total of a bonus across researched technologies.
+
+    Args:
+        bonus_name: Name of bonus to sum
+        researched_mask: Bitmask of researched techs (see tech_mask)
+
+    Returns:
+        Total bonus value
+    """
+    return _bonus_totals(researched_mask).get(bonus_name, 0.0)
+
+
+@lru_cache(maxsize=256)
+def _bonus_totals(researched_mask: int) -> dict[str, float]:
+    """Sum every bonus across researched technologies, memoized per mask.
+
+    Args:
+        researched_mask: Bitmask of researched techs (see tech_mask)
+
+    Returns:
+        Total of each bonus granted by at least one researched tech
+    """
+    totals: dict[str, float] = {}
+    for tech, bit, _ in _TECH_MASKS:
+        if researched_mask & bit:
+            for bonus_name, value in tech.bonuses.items():
+                totals[bonus_name] = totals.get(bonus_name, 0.0) + value
+    return totals
+
+
+def get_available_units_for_mask(researched_mask: int) -> list[UnitType]:
+    """Get unit types buildable with the researched techs in a mask.
+
+    Mask-keyed counterpart of unit_data.get_available_units.
+
+    Args:
+        researched_mask: Bitmask of researched techs (see tech_mask)
+
+    Returns:
+        Buildable unit types in UNIT_STATS order
+    """
+    return list(_available_units(researched_mask))
+
+
+# (unit type, mask of its required tech, or 0 if it needs none)
+_UNIT_REQUIREMENTS: tuple[tuple[UnitType, int], ...] = tuple(
+    (unit_type, tech_mask((stats.tech_requirement,)) if stats.tech_requirement else 0)
+    for unit_type, stats in UNIT_STATS.items()
+)
+assert all(
+    requirement or stats.tech_requirement is None
+    for (_, requirement), stats in zip(_UNIT_REQUIREMENTS, UNIT_STATS.values())
+), "Every unit's tech requirement must be a known technology"
+
+
+@lru_cache(maxsize=256)
+def _available_units(researched_mask: int) -> tuple[UnitType, ...]:
+    """Get buildable unit types for a mask, memoized since the unit table is fixed.
+
+    Args:
+        researched_mask: Bitmask of researched techs (see tech_mask)
+
+    Returns:
+        Buildable unit types in UNIT_STATS order
+    """
+    return tuple(
+        unit_type for unit_type, requirement in _UNIT_REQUIREMENTS
+        if researched_mask & requirement == requirement
+    )
 
 
 def get_all_techs() -> list[Technology]:
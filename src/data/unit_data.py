@@ -24,6 +24,12 @@ class CombatType(Enum):
     RANGED = auto()
 
 
+# Bit flags exposed by Unit.flags
+UNIT_FLAG_ALIVE = 1
+UNIT_FLAG_RANGED = 2
+UNIT_FLAG_MELEE = 4
+
+
 @dataclass(frozen=True)
 class UnitStats:
     """Stats definition for a unit type."""
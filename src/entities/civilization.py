@@ -1,13 +1,17 @@
 """Civilization class representing a player or AI faction."""
 
-from dataclasses import dataclass, field
-from typing import Optional
+import itertools
+from dataclasses import InitVar, dataclass, field
+from typing import Iterable, Optional
 
 from src.map.tile import ResourceType
 from src.core.settings import STARTING_RESOURCES
+from src.data.tech_data import TECH_INDEX, tech_mask
 
+_civ_ids = itertools.count(1)
 
-@dataclass
+
+@dataclass(slots=True)
 class Civilization:
     """Represents a civilization (player or AI)."""
 
@@ -19,20 +23,35 @@ class Civilization:
     # Resources
     resources: dict[ResourceType, int] = field(default_factory=dict)
 
-    # Research
-    researched_techs: set[str] = field(default_factory=set)
+    # Research. Researched techs live in _researched_techs, a frozenset read
+    # and replaced through the researched_techs property or extended by
+    # research_complete, both of which keep tech_bits in sync. initial_techs
+    # seeds it at construction.
+    initial_techs: InitVar[Iterable[str]] = ()
+    _researched_techs: frozenset[str] = field(default=frozenset(), init=False, repr=False)
     current_research: Optional[str] = None
     research_progress: int = 0
 
-    # Units and cities (references, managed externally)
-    unit_ids: list[str] = field(default_factory=list)
-    city_ids: list[str] = field(default_factory=list)
+    # Units and cities (references, managed externally). Insertion-ordered
+    # dicts used as sets, so registering and removing ids is O(1).
+    unit_ids: dict[str, None] = field(default_factory=dict)
+    city_ids: dict[str, None] = field(default_factory=dict)
 
     # State
     is_eliminated: bool = False
 
-    def __post_init__(self):
-        """Initialize resources if not provided."""
+    # Unique integer identifier for cheap ownership checks
+    civ_id: int = field(
+        default_factory=lambda: next(_civ_ids), init=False, repr=False, compare=False
+    )
+
+    # researched_techs as a bitmask over TECH_INDEX
+    tech_bits: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self, initial_techs: Iterable[str]):
+        """Initialize resources if not provided and record initial techs."""
+        if initial_techs:
+            self.researched_techs = initial_techs
         if not self.resources:
             self.resources = {
                 ResourceType.FOOD: STARTING_RESOURCES["FOOD"],
@@ -119,13 +138,31 @@ class Civilization:
         """
         return tech_id in self.researched_techs
 
+    @property
+    def researched_techs(self) -> frozenset[str]:
+        """Get the IDs of researched technologies.
+
+        The set is immutable; replace it by assignment or extend it through
+        research_complete so tech_bits follows.
+        """
+        return self._researched_techs
+
+    @researched_techs.setter
+    def researched_techs(self, tech_ids: Iterable[str]) -> None:
+        """Replace the researched technologies."""
+        self._researched_techs = frozenset(tech_ids)
+        self.tech_bits = tech_mask(self._researched_techs)
+
     def research_complete(self, tech_id: str) -> None:
         """Mark a technology as researched.
 
         Args:
             tech_id: Technology ID to complete
         """
-        self.researched_techs.add(tech_id)
+        self._researched_techs = self._researched_techs | {tech_id}
+        index = TECH_INDEX.get(tech_id)
+        if index is not None:
+            self.tech_bits |= 1 << index
         self.current_research = None
         self.research_progress = 0
 
@@ -152,8 +189,7 @@ class Civilization:
         Args:
             unit_id: Unit ID to add
         """
-        if unit_id not in self.unit_ids:
-            self.unit_ids.append(unit_id)
+        self.unit_ids[unit_id] = None
 
     def remove_unit(self, unit_id: str) -> None:
         """Remove a unit from this civilization.
@@ -161,8 +197,7 @@ class Civilization:
         Args:
             unit_id: Unit ID to remove
         """
-        if unit_id in self.unit_ids:
-            self.unit_ids.remove(unit_id)
+        self.unit_ids.pop(unit_id, None)
 
     def add_city(self, city_id: str) -> None:
         """Register a city to this civilization.
@@ -170,8 +205,7 @@ class Civilization:
         Args:
             city_id: City ID to add
         """
-        if city_id not in self.city_ids:
-            self.city_ids.append(city_id)
+        self.city_ids[city_id] = None
 
     def remove_city(self, city_id: str) -> None:
         """Remove a city from this civilization.
@@ -179,8 +213,7 @@ class Civilization:
         Args:
             city_id: City ID to remove
         """
-        if city_id in self.city_ids:
-            self.city_ids.remove(city_id)
+        self.city_ids.pop(city_id, None)
 
     @property
     def unit_count(self) -> int:
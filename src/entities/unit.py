@@ -4,12 +4,19 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 
-from src.data.unit_data import UnitType, UnitStats, CombatType, get_unit_stats
+from src.data.unit_data import (
+    UnitType, UnitStats, CombatType, get_unit_stats, UNIT_FLAG_MELEE, UNIT_FLAG_RANGED
+)
 
 if TYPE_CHECKING:
     from src.entities.civilization import Civilization
     from src.map.tile import Tile
 
+_COMBAT_TYPE_FLAGS = {
+    CombatType.MELEE: UNIT_FLAG_MELEE,
+    CombatType.RANGED: UNIT_FLAG_RANGED,
+}
+
 
 @dataclass
 class Unit:
@@ -28,16 +35,19 @@ class Unit:
     # Unique identifier
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
 
+    # Shared, immutable stats for the unit type, bound once at creation
+    stats: UnitStats = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Initialize derived attributes from unit stats."""
-        stats = self.stats
+        stats = self.stats = get_unit_stats(self.unit_type)
         self.health = stats.max_health
         self.remaining_movement = stats.movement
 
     @property
-    def stats(self) -> UnitStats:
-        """Get the stats for this unit type."""
-        return get_unit_stats(self.unit_type)
+    def owner_id(self) -> int:
+        """Get the owner's integer id, for cheap ownership checks."""
+        return self.owner.civ_id
 
     @property
     def name(self) -> str:
@@ -94,6 +104,11 @@ class Unit:
         """Check if unit is alive."""
         return self.health > 0
 
+    @property
+    def flags(self) -> int:
+        """Get alive/ranged/melee state packed as UNIT_FLAG_* bits."""
+        return (self.health > 0) | _COMBAT_TYPE_FLAGS[self.stats.combat_type]
+
     @property
     def health_ratio(self) -> float:
         """Get health as a ratio (0.0 to 1.0)."""
@@ -1,7 +1,14 @@
 """Grid class for managing the 2D tile map."""
 
+from collections import Counter
+from itertools import chain
 from typing import Optional, Iterator
-from .tile import Tile, TerrainType
+from .tile import Tile, TerrainType, ResourceType
+
+
+# Neighbor offsets in the order get_neighbors returns them
+_NEIGHBOR_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+_NEIGHBOR_OFFSETS_DIAGONAL = _NEIGHBOR_OFFSETS + ((-1, -1), (-1, 1), (1, -1), (1, 1))
 
 
 class Grid:
@@ -17,6 +24,14 @@ class Grid:
         self.width = width
         self.height = height
         self._tiles: list[list[Tile]] = []
+        # Positions whose appearance changed since the renderer last drew them
+        self.dirty_tiles: set[tuple[int, int]] = set()
+        # Bumped by mark_dirty whenever a tile is replaced or changed, so
+        # caches of per-tile data can tell when they are stale
+        self.tile_version = 0
+        # Flat step-cost table and the tile_version it was built at
+        self._step_costs: Optional[list[Optional[float]]] = None
+        self._step_costs_version = -1
         self._initialize_tiles()
 
     def _initialize_tiles(self) -> None:
@@ -26,9 +41,39 @@ class Grid:
             for y in range(self.height)
         ]
 
+    @property
+    def rows(self) -> list[list[Tile]]:
+        """Get the tile rows, indexed [y][x], for hot loops that bounds-check themselves.
+
+        The rows are the grid's own storage and must not be modified.
+        """
+        return self._tiles
+
+    @property
+    def step_costs(self) -> list[Optional[float]]:
+        """Get the cost to enter each tile, indexed y * width + x.
+
+        Impassable tiles are None. The table is built lazily and rebuilt
+        after set_tile or mark_dirty, so code that changes a tile's terrain
+        once the grid is in use must mark the tile dirty. The table must not
+        be modified.
+        """
+        if self._step_costs is None or self._step_costs_version != self.tile_version:
+            self._step_costs = [
+                tile.movement_cost if tile.is_passable else None
+                for tile in self.all_tiles()
+            ]
+            self._step_costs_version = self.tile_version
+        return self._step_costs
+
     def get_tile(self, x: int, y: int) -> Optional[Tile]:
         """Get a tile at the specified coordinates.
 
+        Tiles are allocated once when the grid is built, so every lookup of a
+        position returns the same instance and unit/city/owner changes made
+        through it are shared. Tests that need a detached tile to mutate
+        should construct Tile directly.
+
         Args:
             x: X coordinate
             y: Y coordinate
@@ -36,9 +81,9 @@ class Grid:
         Returns:
             The tile at (x, y) or None if out of bounds
         """
-        if not self.is_valid_position(x, y):
-            return None
-        return self._tiles[y][x]
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._tiles[y][x]
+        return None
 
     def set_tile(self, x: int, y: int, tile: Tile) -> bool:
         """Set a tile at the specified coordinates.
@@ -54,8 +99,19 @@ class Grid:
         if not self.is_valid_position(x, y):
             return False
         self._tiles[y][x] = tile
+        self.mark_dirty(x, y)
         return True
 
+    def mark_dirty(self, x: int, y: int) -> None:
+        """Mark a tile as changed, so it is redrawn and per-tile caches rebuild.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+        """
+        self.dirty_tiles.add((x, y))
+        self.tile_version += 1
+
     def is_valid_position(self, x: int, y: int) -> bool:
         """Check if coordinates are within the grid bounds.
 
@@ -78,25 +134,21 @@ class Grid:
         Returns:
             List of neighboring tiles
         """
-        neighbors = []
-
-        # Cardinal directions
-        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-
-        if include_diagonals:
-            directions.extend([(-1, -1), (-1, 1), (1, -1), (1, 1)])
-
-        for dx, dy in directions:
-            neighbor = self.get_tile(tile.x + dx, tile.y + dy)
-            if neighbor is not None:
-                neighbors.append(neighbor)
-
-        return neighbors
+        directions = _NEIGHBOR_OFFSETS_DIAGONAL if include_diagonals else _NEIGHBOR_OFFSETS
+        x, y = tile.x, tile.y
+        width, height, rows = self.width, self.height, self._tiles
+
+        return [
+            rows[ny][nx]
+            for dx, dy in directions
+            if 0 <= (nx := x + dx) < width and 0 <= (ny := y + dy) < height
+        ]
 
     def get_tiles_in_range(self, center_x: int, center_y: int, radius: int) -> list[Tile]:
         """Get all tiles within a certain range of a position.
 
-        Uses Manhattan distance for range calculation.
+        Uses Manhattan distance for range calculation. Each row of the
+        diamond is a contiguous run, so it is copied as a slice of the row.
 
         Args:
             center_x: Center X coordinate
@@ -104,16 +156,16 @@ class Grid:
             radius: Maximum distance from center
 
         Returns:
-            List of tiles within range
+            List of tiles within range, in row-major order
         """
         tiles = []
+        width = self.width
         for y in range(max(0, center_y - radius), min(self.height, center_y + radius + 1)):
-            for x in range(max(0, center_x - radius), min(self.width, center_x + radius + 1)):
-                distance = abs(x - center_x) + abs(y - center_y)
-                if distance <= radius:
-                    tile = self.get_tile(x, y)
-                    if tile is not None:
-                        tiles.append(tile)
+            half = radius - abs(y - center_y)
+            start = max(0, center_x - half)
+            stop = min(width, center_x + half + 1)
+            if start < stop:
+                tiles += self._tiles[y][start:stop]
         return tiles
 
     def get_tiles_at_range(self, center_x: int, center_y: int, radius: int) -> list[Tile]:
@@ -125,16 +177,17 @@ class Grid:
             radius: Exact distance from center
 
         Returns:
-            List of tiles at exact range
+            List of tiles at exact range, in row-major order
         """
         tiles = []
+        width = self.width
         for y in range(max(0, center_y - radius), min(self.height, center_y + radius + 1)):
-            for x in range(max(0, center_x - radius), min(self.width, center_x + radius + 1)):
-                distance = abs(x - center_x) + abs(y - center_y)
-                if distance == radius:
-                    tile = self.get_tile(x, y)
-                    if tile is not None:
-                        tiles.append(tile)
+            half = radius - abs(y - center_y)
+            row = self._tiles[y]
+            if 0 <= center_x - half < width:
+                tiles.append(row[center_x - half])
+            if half and 0 <= center_x + half < width:
+                tiles.append(row[center_x + half])
         return tiles
 
     def find_tiles_by_terrain(self, terrain: TerrainType) -> list[Tile]:
@@ -146,7 +199,7 @@ class Grid:
         Returns:
             List of matching tiles
         """
-        return [tile for tile in self.all_tiles() if tile.terrain == terrain]
+        return [tile for tile in chain.from_iterable(self._tiles) if tile.terrain is terrain]
 
     def find_passable_tiles(self) -> list[Tile]:
         """Find all passable tiles.
@@ -154,17 +207,55 @@ class Grid:
         Returns:
             List of passable tiles
         """
-        return [tile for tile in self.all_tiles() if tile.is_passable]
+        return [tile for tile in chain.from_iterable(self._tiles) if tile.is_passable]
+
+    def terrain_histogram(self) -> dict[TerrainType, int]:
+        """Count the tiles of each terrain type.
+
+        Returns:
+            Tile count for every terrain type, including absent ones
+        """
+        counts = Counter(tile.terrain for tile in chain.from_iterable(self._tiles))
+        return {terrain: counts[terrain] for terrain in TerrainType}
+
+    def passable_ratio(self) -> float:
+        """Get the fraction of tiles units can move through.
+
+        Returns:
+            Passable tiles divided by total tiles
+        """
+        step_costs = self.step_costs
+        return 1 - step_costs.count(None) / len(step_costs)
+
+    def count_resources(self) -> int:
+        """Count the tiles holding a resource.
+
+        Returns:
+            Number of tiles with a resource
+        """
+        return sum(tile.resource is not None for tile in chain.from_iterable(self._tiles))
+
+    @property
+    def terrain_rows(self) -> tuple[tuple[TerrainType, ...], ...]:
+        """Get a snapshot of every tile's terrain, indexed [y][x].
+
+        Two grids have the same terrain exactly when their snapshots compare
+        equal, which is a single comparison rather than one per tile.
+        """
+        return tuple(tuple(tile.terrain for tile in row) for row in self._tiles)
+
+    @property
+    def resource_rows(self) -> tuple[tuple[Optional[ResourceType], ...], ...]:
+        """Get a snapshot of every tile's resource, indexed [y][x]."""
+        return tuple(tuple(tile.resource for tile in row) for row in self._tiles)
 
     def all_tiles(self) -> Iterator[Tile]:
         """Iterate over all tiles in the grid.
 
-        Yields:
-            Each tile in row-major order
+        Returns:
+            Iterator over each tile in row-major order
         """
-        for row in self._tiles:
-            for tile in row:
-                yield tile
+        return chain.from_iterable(self._tiles)
 
     def get_distance(self, x1: int, y1: int, x2: int, y2: int) -> int:
         """Calculate Manhattan distance between two positions.
@@ -8,6 +8,15 @@ from src.map.grid import Grid
 from src.map.tile import Tile, TerrainType, ResourceType
 from src.data.resource_data import RESOURCE_SPAWN_CHANCES
 
+# Starting positions need resources within this Manhattan distance
+STARTING_RESOURCE_RADIUS = 3
+
+# (row offset into padded prefix sums, half-width) for each row of the diamond
+_DIAMOND_ROWS = tuple(
+    (dy + STARTING_RESOURCE_RADIUS, STARTING_RESOURCE_RADIUS - abs(dy))
+    for dy in range(-STARTING_RESOURCE_RADIUS, STARTING_RESOURCE_RADIUS + 1)
+)
+
 
 class MapGenerator:
     """Generates procedural maps using smoothed random values."""
@@ -84,6 +93,10 @@ class MapGenerator:
     def _smooth_map(self, map_data: list[list[float]], width: int, height: int) -> list[list[float]]:
         """Apply a smoothing pass to a 2D map.
 
+        Each cell becomes the mean of its 3x3 neighborhood, with the center
+        counted twice. Interior cells are summed in one expression, in the
+        same order as the edge loop, so results are bit-for-bit identical.
+
         Args:
             map_data: 2D list of values
             width: Map width
@@ -92,24 +105,37 @@ class MapGenerator:
         Returns:
             Smoothed map
         """
-        smoothed = [[0.0 for _ in range(width)] for _ in range(height)]
-
-        for y in range(height):
-            for x in range(width):
-                total = 0.0
-                count = 0
-
-                # Sample 3x3 neighborhood
-                for dy in range(-1, 2):
-                    for dx in range(-1, 2):
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < width and 0 <= ny < height:
-                            # Center has more weight
-                            weight = 2 if (dx == 0 and dy == 0) else 1
-                            total += map_data[ny][nx] * weight
-                            count += weight
-
-                smoothed[y][x] = total / count if count > 0 else 0.0
+        smoothed = [[0.0] * width for _ in range(height)]
+
+        # Interior cells always see the full neighborhood (weight 10)
+        for y in range(1, height - 1):
+            above, row, below = map_data[y - 1], map_data[y], map_data[y + 1]
+            out = smoothed[y]
+            for x in range(1, width - 1):
+                out[x] = (
+                    above[x - 1] + above[x] + above[x + 1]
+                    + row[x - 1] + row[x] * 2 + row[x + 1]
+                    + below[x - 1] + below[x] + below[x + 1]
+                ) / 10
+
+        # Border cells have a clipped neighborhood
+        border = [(x, y) for y in (0, height - 1) for x in range(width)]
+        border += [(x, y) for y in range(1, height - 1) for x in (0, width - 1)]
+        for x, y in border:
+            total = 0.0
+            count = 0
+
+            # Sample 3x3 neighborhood
+            for dy in range(-1, 2):
+                for dx in range(-1, 2):
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < width and 0 <= ny < height:
+                        # Center has more weight
+                        weight = 2 if (dx == 0 and dy == 0) else 1
+                        total += map_data[ny][nx] * weight
+                        count += weight
+
+            smoothed[y][x] = total / count if count > 0 else 0.0
 
         return smoothed
 
@@ -173,10 +199,11 @@ class MapGenerator:
             List of (x, y) starting positions
         """
         candidates = []
+        resource_prefix = self._resource_prefix_sums(grid)
 
         # Find all valid candidate tiles
         for tile in grid.all_tiles():
-            if self._is_valid_starting_position(tile, grid):
+            if self._is_valid_starting_position(tile, grid, resource_prefix):
                 candidates.append(tile)
 
         if len(candidates) < num_civs:
@@ -205,12 +232,43 @@ class MapGenerator:
 
         return positions
 
-    def _is_valid_starting_position(self, tile: Tile, grid: Grid) -> bool:
+    @staticmethod
+    def _resource_prefix_sums(grid: Grid) -> list[list[int]]:
+        """Count resource tiles cumulatively along each row, padded by the search radius.
+
+        Rows and columns are padded with STARTING_RESOURCE_RADIUS empty cells
+        on every side, so diamond lookups near the edge need no clipping.
+
+        Args:
+            grid: The game grid
+
+        Returns:
+            Padded rows; with p = STARTING_RESOURCE_RADIUS, prefix[y + p] holds
+            grid row y, and counts[x + p + h + 1] - counts[x + p - h] is the
+            number of resource tiles in its columns [x - h, x + h]
+        """
+        pad = STARTING_RESOURCE_RADIUS
+        empty = [0] * (grid.width + 2 * pad + 1)
+        prefix = [empty] * pad
+        for row in grid.rows:
+            counts = [0] * (pad + 1)
+            total = 0
+            for tile in row:
+                total += tile.resource is not None
+                counts.append(total)
+            counts += [total] * pad
+            prefix.append(counts)
+        prefix += [empty] * pad
+        return prefix
+
+    def _is_valid_starting_position(self, tile: Tile, grid: Grid,
+                                    resource_prefix: list[list[int]]) -> bool:
         """Check if a tile is a valid starting position.
 
         Args:
             tile: The tile to check
             grid: The game grid
+            resource_prefix: Padded row prefix sums from _resource_prefix_sums
 
         Returns:
             True if valid starting position
@@ -225,9 +283,13 @@ class MapGenerator:
         if water_count > 2:
             return False
 
-        # Check for resources within 3 tiles
-        nearby_tiles = grid.get_tiles_in_range(tile.x, tile.y, 3)
-        resource_count = sum(1 for t in nearby_tiles if t.resource is not None)
+        # Check for resources within 3 tiles, one diamond row at a time
+        x = tile.x + STARTING_RESOURCE_RADIUS
+        y = tile.y
+        resource_count = 0
+        for dy, half in _DIAMOND_ROWS:
+            counts = resource_prefix[y + dy]
+            resource_count += counts[x + half + 1] - counts[x - half]
         if resource_count < 2:
             return False
 
@@ -243,11 +305,7 @@ class MapGenerator:
             True if map is playable
         """
         # Check that there's enough passable land
-        passable_tiles = list(grid.find_passable_tiles())
-        total_tiles = grid.width * grid.height
-        land_ratio = len(passable_tiles) / total_tiles
-
-        if land_ratio < 0.3:  # At least 30% land
+        if grid.passable_ratio() < 0.3:  # At least 30% land
             return False
 
         # Check that we can find starting positions for 3 civs
@@ -1,6 +1,7 @@
 """A* pathfinding implementation."""
 
 import heapq
+from functools import lru_cache
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -46,71 +47,95 @@ def find_path(
     if not goal.is_passable:
         return []
 
-    # Priority queue: (f_score, counter, tile)
+    owner_id = unit.owner_id if unit else None
+    rows = grid.rows
+    step_costs = grid.step_costs
+    width, height = grid.width, grid.height
+    gx, gy = goal.x, goal.y
+    goal_index = gy * width + gx
+
+    # The search runs on plain ints: tiles are keyed by flat index
+    # (y * width + x), terrain is read from the grid's step-cost table and
+    # tiles are only looked up to check occupants.
+    # Tiles also hash through a Python-level __hash__, which ints avoid.
+
+    # Priority queue: (f_score, counter, index)
     # Counter is used to break ties in a deterministic way
     counter = 0
-    open_set = []
-    heapq.heappush(open_set, (0, counter, start))
+    start_index = start.y * width + start.x
+    open_set = [(0, counter, start_index)]
 
-    came_from: dict['Tile', 'Tile'] = {}
-    g_score: dict['Tile', float] = {start: 0}
-    f_score: dict['Tile', float] = {start: heuristic(start, goal)}
-
-    open_set_hash = {start}
+    came_from: dict[int, int] = {}
+    g_score: dict[int, float] = {start_index: 0}
+    closed: set[int] = set()
 
     while open_set:
-        current = heapq.heappop(open_set)[2]
-        open_set_hash.discard(current)
+        _, _, index = heapq.heappop(open_set)
 
-        if current == goal:
-            return _reconstruct_path(came_from, current)
+        # A tile is pushed again whenever its cost improves; skip stale entries
+        if index in closed:
+            continue
 
-        for neighbor in grid.get_neighbors(current):
-            # Check if passable
-            if not neighbor.is_passable:
+        if index == goal_index:
+            return _reconstruct_path(grid, came_from, index)
+
+        closed.add(index)
+        current_g = g_score[index]
+        y, x = divmod(index, width)
+
+        for nx, ny, neighbor_index in (
+            (x, y - 1, index - width),
+            (x, y + 1, index + width),
+            (x - 1, y, index - 1),
+            (x + 1, y, index + 1),
+        ):
+            # Check if on the map, passable and not yet settled
+            if not (0 <= nx < width and 0 <= ny < height) or neighbor_index in closed:
+                continue
+            step_cost = step_costs[neighbor_index]
+            if step_cost is None:
                 continue
 
             # Check if blocked by unit (unless it's the goal and we're attacking)
-            if neighbor.has_unit():
-                if neighbor != goal:
+            occupant = rows[ny][nx].unit
+            if occupant is not None:
+                if neighbor_index != goal_index:
                     continue
                 # Allow moving to goal if it has an enemy unit (for attack)
-                if unit and neighbor.unit and neighbor.unit.owner == unit.owner:
+                if owner_id is not None and occupant.owner_id == owner_id:
                     continue  # Can't move onto friendly units
 
-            movement_cost = neighbor.movement_cost
-            tentative_g = g_score[current] + movement_cost
-
-            if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g
-                f_score[neighbor] = tentative_g + heuristic(neighbor, goal)
+            tentative_g = current_g + step_cost
 
-                if neighbor not in open_set_hash:
-                    counter += 1
-                    heapq.heappush(open_set, (f_score[neighbor], counter, neighbor))
-                    open_set_hash.add(neighbor)
+            if tentative_g < g_score.get(neighbor_index, float('inf')):
+                came_from[neighbor_index] = index
+                g_score[neighbor_index] = tentative_g
+                # Manhattan heuristic, as in heuristic()
+                f_score = tentative_g + abs(nx - gx) + abs(ny - gy)
+                counter += 1
+                heapq.heappush(open_set, (f_score, counter, neighbor_index))
 
     return []  # No path found
 
 
-def _reconstruct_path(came_from: dict['Tile', 'Tile'], current: 'Tile') -> list['Tile']:
+def _reconstruct_path(grid: 'Grid', came_from: dict[int, int], index: int) -> list['Tile']:
     """Reconstruct path from came_from dict.
 
     Args:
-        came_from: Dictionary mapping tiles to their predecessor
-        current: Goal tile
+        grid: The game grid
+        came_from: Dictionary mapping tile indices to their predecessor's index
+        index: Goal tile index
 
     Returns:
         Path from start to goal (excluding start, including goal)
     """
-    path = [current]
-    while current in came_from:
-        current = came_from[current]
-        path.append(current)
+    width = grid.width
+    path = []
+    while index in came_from:
+        y, x = divmod(index, width)
+        path.append(grid.get_tile(x, y))
+        index = came_from[index]
 
-    # Remove start tile and reverse
-    path.pop()  # Remove start
     path.reverse()
     return path
 
@@ -134,40 +159,58 @@ def get_reachable_tiles(
     Returns:
         Dictionary mapping reachable tiles to their movement cost
     """
-    reachable: dict['Tile', int] = {start: 0}
-
-    # Priority queue: (cost, counter, tile)
+    owner_id = unit.owner_id if unit else None
+    rows = grid.rows
+    step_costs = grid.step_costs
+    width, height = grid.width, grid.height
+
+    # Costs are keyed by flat index (y * width + x) while searching, since
+    # tiles hash through a Python-level __hash__
+    start_index = start.y * width + start.x
+    costs: dict[int, int] = {start_index: 0}
+    reachable: dict['Tile', int] = {}
+
+    # Priority queue: (cost, counter, index, tile)
     counter = 0
-    open_set = []
-    heapq.heappush(open_set, (0, counter, start))
+    open_set = [(0, counter, start_index, start)]
 
     while open_set:
-        current_cost, _, current = heapq.heappop(open_set)
+        current_cost, _, index, current = heapq.heappop(open_set)
 
-        if current_cost > reachable.get(current, float('inf')):
+        if current_cost > costs[index]:
             continue
 
-        for neighbor in grid.get_neighbors(current):
-            # Check if passable
-            if not neighbor.is_passable:
+        x, y = current.x, current.y
+        for nx, ny, neighbor_index in (
+            (x, y - 1, index - width),
+            (x, y + 1, index + width),
+            (x - 1, y, index - 1),
+            (x + 1, y, index + 1),
+        ):
+            # Check if on the map and passable
+            if not (0 <= nx < width and 0 <= ny < height):
                 continue
+            step_cost = step_costs[neighbor_index]
+            if step_cost is None:
+                continue
+            neighbor = rows[ny][nx]
 
             # Check if blocked by unit
-            if neighbor.has_unit():
-                if unit and neighbor.unit.owner == unit.owner:
+            occupant = neighbor.unit
+            if occupant is not None:
+                if owner_id is not None and occupant.owner_id == owner_id:
                     continue  # Can't move through friendly units
                 # Can move to enemy units (for attack), but can't pass through
                 # So we add it as reachable but don't continue from it
 
-            new_cost = current_cost + neighbor.movement_cost
+            new_cost = current_cost + step_cost
 
-            if new_cost <= movement and new_cost < reachable.get(neighbor, float('inf')):
+            if new_cost <= movement and new_cost < costs.get(neighbor_index, float('inf')):
+                costs[neighbor_index] = new_cost
                 reachable[neighbor] = new_cost
                 counter += 1
-                heapq.heappush(open_set, (new_cost, counter, neighbor))
+                heapq.heappush(open_set, (new_cost, counter, neighbor_index, neighbor))
 
-    # Remove start tile from result
-    del reachable[start]
     return reachable
 
 
@@ -183,12 +226,35 @@ def get_path_cost(path: list['Tile']) -> int:
     return sum(tile.movement_cost for tile in path)
 
 
+@lru_cache(maxsize=None)
+def _attack_offsets(attack_range: int, melee: bool) -> tuple[tuple[int, int], ...]:
+    """Get the (dx, dy) offsets a unit can attack, in row-major order.
+
+    Args:
+        attack_range: Unit attack range
+        melee: Whether the unit is limited to adjacent targets
+
+    Returns:
+        Offsets at Manhattan distance 1..range (exactly 1 for melee)
+    """
+    max_distance = 1 if melee else attack_range
+    return tuple(
+        (dx, dy)
+        for dy in range(-attack_range, attack_range + 1)
+        for dx in range(-attack_range, attack_range + 1)
+        if 0 < abs(dx) + abs(dy) <= max_distance
+    )
+
+
 def get_tiles_in_attack_range(
     grid: 'Grid',
     unit: 'Unit'
 ) -> list['Tile']:
     """Get all tiles a unit can attack from current position.
 
+    Melee units can only attack adjacent tiles; ranged units can attack at
+    any distance up to their range.
+
     Args:
         grid: The game grid
         unit: The attacking unit
@@ -196,28 +262,13 @@ def get_tiles_in_attack_range(
     Returns:
         List of tiles within attack range
     """
-    start_tile = grid.get_tile(unit.x, unit.y)
-    if not start_tile:
+    ux, uy = unit.x, unit.y
+    get_tile = grid.get_tile
+    if get_tile(ux, uy) is None:
         return []
 
-    attackable = []
-    attack_range = unit.range
-
-    # Get all tiles within range
-    for tile in grid.get_tiles_in_range(unit.x, unit.y, attack_range):
-        if tile == start_tile:
-            continue
-
-        distance = abs(tile.x - unit.x) + abs(tile.y - unit.y)
-
-        # Melee units can only attack adjacent
-        if unit.is_melee and distance != 1:
-            continue
-
-        # Ranged units can attack at any distance up to range
-        if unit.is_ranged and distance > attack_range:
-            continue
-
-        attackable.append(tile)
-
-    return attackable
+    return [
+        tile
+        for dx, dy in _attack_offsets(unit.range, unit.is_melee)
+        if (tile := get_tile(ux + dx, uy + dy)) is not None
+    ]
@@ -48,6 +48,15 @@ TERRAIN_RESOURCES = {
     TerrainType.HILLS: [ResourceType.STONE],
 }
 
+# Flat lookup tables indexed by TerrainType.value - 1, in member order
+TERRAIN_MOVEMENT_COSTS = tuple(TERRAIN_PROPERTIES[t]["movement_cost"] for t in TerrainType)
+TERRAIN_DEFENSE_BONUSES = tuple(TERRAIN_PROPERTIES[t]["defense_bonus"] for t in TerrainType)
+TERRAIN_PASSABLE = tuple(TERRAIN_PROPERTIES[t]["passable"] for t in TerrainType)
+
+# The tables above are only valid while member values run 1..N in order
+assert [t.value for t in TerrainType] == list(range(1, len(TerrainType) + 1)), \
+    "TerrainType values must be contiguous from 1 to index terrain tables"
+
 
 @dataclass(eq=False)
 class Tile:
@@ -74,17 +83,17 @@ class Tile:
     @property
     def movement_cost(self) -> float:
         """Get the movement cost to enter this tile."""
-        return TERRAIN_PROPERTIES[self.terrain]["movement_cost"]
+        return TERRAIN_MOVEMENT_COSTS[self.terrain.value - 1]
 
     @property
     def defense_bonus(self) -> float:
         """Get the defense bonus this tile provides."""
-        return TERRAIN_PROPERTIES[self.terrain]["defense_bonus"]
+        return TERRAIN_DEFENSE_BONUSES[self.terrain.value - 1]
 
     @property
     def is_passable(self) -> bool:
         """Check if units can move through this tile."""
-        return TERRAIN_PROPERTIES[self.terrain]["passable"]
+        return TERRAIN_PASSABLE[self.terrain.value - 1]
 
     @property
     def position(self) -> tuple[int, int]:
@@ -109,11 +118,9 @@ class Tile:
 
     def can_enter(self, unit: Optional['Unit'] = None) -> bool:
         """Check if a unit can enter this tile."""
-        if not self.is_passable:
-            return False
-        if self.has_unit():
-            # Can't enter if there's already a unit (unless it's an enemy for attack)
-            if unit is not None and self.unit.owner != unit.owner:
-                return True  # Can attack
-            return False
-        return True
+        # Can't enter if there's already a unit (unless it's an enemy for attack)
+        occupant = self.unit
+        return TERRAIN_PASSABLE[self.terrain.value - 1] and (
+            occupant is None
+            or (unit is not None and occupant.owner_id != unit.owner_id)
+        )
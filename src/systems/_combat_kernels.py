@@ -0,0 +1,95 @@
+"""Scalar combat kernels.
+
+Kept free of game objects so callers hoist unit and tile lookups once and
+the arithmetic runs on plain integers.
+"""
+
+
+# Damage modifiers are kept as 16.16 fixed-point integers so the damage
+# pipeline runs entirely on integer arithmetic.
+FIXED_POINT_SHIFT = 16
+FIXED_POINT_ONE = 1 << FIXED_POINT_SHIFT
+
+
+def damage(
+    attack: int,
+    defense: int,
+    terrain_modifier: int,
+    health: int,
+    max_health: int,
+    range_modifier: int
+) -> int:
+    """Compute damage from scalar combat values.
+
+    Args:
+        attack: Attacker's attack strength
+        defense: Defender's defense strength
+        terrain_modifier: Fixed-point terrain damage modifier
+        health: Attacker's current health
+        max_health: Attacker's maximum health
+        range_modifier: Fixed-point range penalty modifier
+
+    Returns:
+        Damage to deal (minimum 1)
+    """
+    # Base damage attack * 100 / (100 + defense) times the health modifier
+    # 0.5 + ratio * 0.5 = (max_health + health) / (2 * max_health), kept as
+    # one exact fraction so the result is floored only once
+    amount = (
+        attack * 100 * terrain_modifier * (max_health + health) * range_modifier
+    ) // (((100 + defense) * 2 * max_health) << (2 * FIXED_POINT_SHIFT))
+
+    return amount if amount else 1  # Minimum 1 damage
+
+
+def exchange(
+    attack: int,
+    defense: int,
+    health: int,
+    max_health: int,
+    range_modifier: int,
+    terrain_modifier: int,
+    counter_attack: int,
+    counter_defense: int,
+    counter_health: int,
+    counter_max_health: int,
+    counter_range_modifier: int,
+    counter_terrain_modifier: int,
+    can_counter: bool
+) -> tuple[int, int]:
+    """Compute both directions of a combat exchange in one pass.
+
+    The counter side is the defender: its attack and health are used for the
+    counterattack, its defense and tile for the initial blow.
+
+    Args:
+        attack: Attacker's attack strength
+        defense: Attacker's defense strength
+        health: Attacker's current health
+        max_health: Attacker's maximum health
+        range_modifier: Fixed-point range modifier for the attack
+        terrain_modifier: Fixed-point terrain modifier of the attacker's tile
+        counter_attack: Defender's attack strength
+        counter_defense: Defender's defense strength
+        counter_health: Defender's current health
+        counter_max_health: Defender's maximum health
+        counter_range_modifier: Fixed-point range modifier for the counter
+        counter_terrain_modifier: Fixed-point terrain modifier of the defender's tile
+        can_counter: Whether a surviving defender can strike back
+
+    Returns:
+        Tuple of (damage to defender, damage to attacker)
+    """
+    damage_to_defender = damage(
+        attack, counter_defense, counter_terrain_modifier, health, max_health, range_modifier
+    )
+
+    remaining = counter_health - damage_to_defender
+    if not can_counter or remaining <= 0:
+        return damage_to_defender, 0
+
+    damage_to_attacker = damage(
+        counter_attack, defense, terrain_modifier, remaining, counter_max_health,
+        counter_range_modifier
+    )
+    return damage_to_defender, damage_to_attacker
@@ -1,17 +1,54 @@
 """Combat system for resolving battles."""
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
-from src.data.unit_data import CombatType
+from src.data.unit_data import CombatType, UNIT_FLAG_ALIVE, UNIT_FLAG_RANGED
+from src.map.tile import TERRAIN_DEFENSE_BONUSES
+from src.systems._combat_kernels import FIXED_POINT_ONE, damage as _damage_kernel, exchange
 
 if TYPE_CHECKING:
     from src.entities.unit import Unit
     from src.map.tile import Tile
 
 
-@dataclass
-class CombatResult:
+# Terrain damage modifier (1 - defense_bonus), indexed by TerrainType.value - 1
+TERRAIN_DAMAGE_MODIFIERS = tuple(
+    int((1 - bonus) * FIXED_POINT_ONE) for bonus in TERRAIN_DEFENSE_BONUSES
+)
+
+# Damage multiplier for ranged units attacking at max range (0.75)
+RANGE_PENALTY_MODIFIER = (FIXED_POINT_ONE * 3) >> 2
+
+# Bits of a counterattack table index, laid out so unit flags shift into place
+_COUNTER_DEFENDER_ALIVE = UNIT_FLAG_ALIVE << 3
+_COUNTER_DEFENDER_RANGED = UNIT_FLAG_RANGED << 3
+_COUNTER_ATTACKER_RANGED = UNIT_FLAG_RANGED << 1
+_COUNTER_AT_DISTANCE = 2  # Distance greater than 1
+_COUNTER_IN_RANGE = 1  # 1 <= distance <= defender range
+
+
+def _build_counter_table() -> bytes:
+    """Evaluate the counterattack rules for every index combination.
+
+    Returns:
+        32-entry table of 0/1 counterattack outcomes
+    """
+    table = bytearray(32)
+    for index in range(32):
+        if not index & _COUNTER_DEFENDER_ALIVE or not index & _COUNTER_IN_RANGE:
+            continue
+        # Ranged attackers at range > 1 don't receive counterattacks from melee
+        if (index & _COUNTER_AT_DISTANCE and not index & _COUNTER_DEFENDER_RANGED
+                and index & _COUNTER_ATTACKER_RANGED):
+            continue
+        table[index] = 1
+    return bytes(table)
+
+
+_COUNTER_TABLE = _build_counter_table()
+
+
+class CombatResult(NamedTuple):
     """Result of a combat encounter."""
     attacker_damage: int  # Damage dealt to attacker
     defender_damage: int  # Damage dealt to defender
@@ -19,6 +56,12 @@ class CombatResult:
     defender_killed: bool
 
 
+class ExpectedDamage(NamedTuple):
+    """Expected damage exchange for AI evaluation."""
+    damage_to_defender: int
+    damage_to_attacker: int  # Expected counterattack damage
+
+
 class CombatSystem:
     """Handles combat calculations between units."""
 
@@ -46,24 +89,21 @@ class CombatSystem:
         Returns:
             Damage to deal
         """
-        # Base damage formula
-        base_damage = attacker.attack * (100 / (100 + defender.defense))
-
-        # Terrain defense modifier
-        terrain_modifier = 1 - defender_tile.defense_bonus
-
-        # Health modifier (damaged units deal less damage)
-        health_modifier = attacker.get_damage_modifier()
+        stats = attacker.stats
 
         # Range penalty for ranged units at max range
-        range_modifier = 1.0
-        if attacker.is_ranged and distance == attacker.range:
-            range_modifier = 0.75
-
-        # Calculate final damage
-        final_damage = base_damage * terrain_modifier * health_modifier * range_modifier
-
-        return max(1, int(final_damage))  # Minimum 1 damage
+        range_modifier = FIXED_POINT_ONE
+        if stats.combat_type == CombatType.RANGED and distance == stats.range:
+            range_modifier = RANGE_PENALTY_MODIFIER
+
+        return _damage_kernel(
+            stats.attack,
+            defender.defense,
+            TERRAIN_DAMAGE_MODIFIERS[defender_tile.terrain.value - 1],
+            attacker.health,
+            stats.max_health,
+            range_modifier,
+        )
 
     @staticmethod
     def can_counterattack(defender: 'Unit', attacker: 'Unit', distance: int) -> bool:
@@ -82,15 +122,14 @@ class CombatSystem:
         Returns:
             True if defender can counterattack
         """
-        if not defender.is_alive:
-            return False
-
-        # Ranged attackers at range > 1 don't receive counterattacks from melee
-        if attacker.is_ranged and distance > 1 and defender.is_melee:
-            return False
-
-        # Defender must be able to attack at this distance
-        return defender.can_attack_at_range(distance)
+        # Melee units have range 1, so the range bit also covers "adjacent only"
+        index = (
+            (defender.flags & (UNIT_FLAG_ALIVE | UNIT_FLAG_RANGED)) << 3
+            | (attacker.flags & UNIT_FLAG_RANGED) << 1
+            | (distance > 1) << 1
+            | (1 <= distance <= defender.range)
+        )
+        return bool(_COUNTER_TABLE[index])
 
     @staticmethod
     def resolve_combat(
@@ -111,48 +150,72 @@ class CombatSystem:
             CombatResult with outcome
         """
         distance = abs(attacker.x - defender.x) + abs(attacker.y - defender.y)
+        attacker_stats = attacker.stats
+        defender_stats = defender.stats
+        attacker_ranged = attacker_stats.combat_type == CombatType.RANGED
+        defender_ranged = defender_stats.combat_type == CombatType.RANGED
+
+        # Counter eligibility assuming the defender survives; the kernel checks that
+        counter_index = (
+            _COUNTER_DEFENDER_ALIVE
+            | (_COUNTER_DEFENDER_RANGED if defender_ranged else 0)
+            | (_COUNTER_ATTACKER_RANGED if attacker_ranged else 0)
+            | (distance > 1) << 1
+            | (1 <= distance <= defender_stats.range)
+        )
 
-        # Calculate and apply attacker's damage to defender
-        attacker_damage_dealt = CombatSystem.calculate_damage(
-            attacker, defender, defender_tile, distance
+        attacker_damage_dealt, defender_damage_dealt = exchange(
+            attacker_stats.attack,
+            attacker_stats.defense,
+            attacker.health,
+            attacker_stats.max_health,
+            RANGE_PENALTY_MODIFIER if attacker_ranged and distance == attacker_stats.range
+            else FIXED_POINT_ONE,
+            TERRAIN_DAMAGE_MODIFIERS[attacker_tile.terrain.value - 1],
+            defender_stats.attack,
+            defender_stats.defense,
+            defender.health,
+            defender_stats.max_health,
+            RANGE_PENALTY_MODIFIER if defender_ranged and distance == defender_stats.range
+            else FIXED_POINT_ONE,
+            TERRAIN_DAMAGE_MODIFIERS[defender_tile.terrain.value - 1],
+            _COUNTER_TABLE[counter_index],
         )
         defender.take_damage(attacker_damage_dealt)
-
-        # Check for counterattack
-        defender_damage_dealt = 0
-        if CombatSystem.can_counterattack(defender, attacker, distance):
-            defender_damage_dealt = CombatSystem.calculate_damage(
-                defender, attacker, attacker_tile, distance
-            )
-            attacker.take_damage(defender_damage_dealt)
+        attacker.take_damage(defender_damage_dealt)
 
         # Mark attacker as having attacked
         attacker.attack_target()
 
+        # Positional, in CombatResult field order
         return CombatResult(
-            attacker_damage=defender_damage_dealt,
-            defender_damage=attacker_damage_dealt,
-            attacker_killed=not attacker.is_alive,
-            defender_killed=not defender.is_alive,
+            defender_damage_dealt,
+            attacker_damage_dealt,
+            attacker.health <= 0,
+            defender.health <= 0,
         )
 
     @staticmethod
     def calculate_expected_damage(
         attacker: 'Unit',
         defender: 'Unit',
-        defender_tile: 'Tile'
-    ) -> tuple[int, int]:
+        defender_tile: 'Tile',
+        distance: Optional[int] = None
+    ) -> ExpectedDamage:
         """Calculate expected damage for AI evaluation.
 
         Args:
             attacker: Attacking unit
             defender: Defending unit
             defender_tile: Tile the defender is on
+            distance: Attack distance, for hypothetical positions; defaults
+                to the distance between the units
 
         Returns:
-            Tuple of (damage_to_defender, expected_counterattack_damage)
+            ExpectedDamage of (damage_to_defender, damage_to_attacker)
         """
-        distance = abs(attacker.x - defender.x) + abs(attacker.y - defender.y)
+        if distance is None:
+            distance = abs(attacker.x - defender.x) + abs(attacker.y - defender.y)
 
         damage_to_defender = CombatSystem.calculate_damage(
             attacker, defender, defender_tile, distance
@@ -169,7 +232,71 @@ class CombatSystem:
                 base_counter = defender.attack * (100 / (100 + attacker.defense))
                 damage_to_attacker = int(base_counter * (0.5 + health_ratio * 0.5))
 
-        return (damage_to_defender, damage_to_attacker)
+        return ExpectedDamage(damage_to_defender, damage_to_attacker)
+
+    @staticmethod
+    def calculate_odds_matrix(
+        attackers: list['Unit'],
+        defenders: list['Unit'],
+        defender_tiles: list['Tile']
+    ) -> list[list[ExpectedDamage]]:
+        """Calculate expected damage for every attacker/defender pair.
+
+        Equivalent to calling calculate_expected_damage per pair, with
+        per-unit values hoisted out of the pair loop.
+
+        Args:
+            attackers: Attacking units
+            defenders: Defending units
+            defender_tiles: Tile each defender is on, parallel to defenders
+
+        Returns:
+            Matrix indexed [attacker][defender] of ExpectedDamage
+        """
+        defender_info = [
+            (
+                defender,
+                defender.x,
+                defender.y,
+                defender.defense,
+                defender.health,
+                TERRAIN_DAMAGE_MODIFIERS[tile.terrain.value - 1],
+            )
+            for defender, tile in zip(defenders, defender_tiles)
+        ]
+
+        matrix = []
+        for attacker in attackers:
+            stats = attacker.stats
+            ax, ay = attacker.x, attacker.y
+            attack, health, max_health = stats.attack, attacker.health, stats.max_health
+            attacker_defense = stats.defense
+            max_range = stats.range if stats.combat_type == CombatType.RANGED else None
+
+            row = []
+            for defender, dx, dy, defense, defender_health, terrain_modifier in defender_info:
+                distance = abs(ax - dx) + abs(ay - dy)
+                range_modifier = (
+                    RANGE_PENALTY_MODIFIER if distance == max_range else FIXED_POINT_ONE
+                )
+                damage_to_defender = _damage_kernel(
+                    attack, defense, terrain_modifier, health, max_health, range_modifier
+                )
+
+                # Estimate counterattack damage, as in calculate_expected_damage
+                damage_to_attacker = 0
+                simulated_health = defender_health - damage_to_defender
+                if simulated_health > 0 and CombatSystem.can_counterattack(
+                    defender, attacker, distance
+                ):
+                    health_ratio = simulated_health / defender.max_health
+                    base_counter = defender.attack * (100 / (100 + attacker_defense))
+                    damage_to_attacker = int(base_counter * (0.5 + health_ratio * 0.5))
+
+                row.append(ExpectedDamage(damage_to_defender, damage_to_attacker))
+            matrix.append(row)
+
+        return matrix
 
     @staticmethod
     def get_combat_odds(attacker: 'Unit', defender: 'Unit', defender_tile: 'Tile') -> float:
@@ -1,6 +1,6 @@
 """Resource management system."""
 
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from src.map.tile import ResourceType
 from src.data.resource_data import BASE_CITY_INCOME, RESOURCE_YIELDS
@@ -8,6 +8,11 @@ from src.data.resource_data import BASE_CITY_INCOME, RESOURCE_YIELDS
 if TYPE_CHECKING:
     from src.core.game_state import GameState
     from src.entities.civilization import Civilization
+    from src.map.grid import Grid
+    from src.map.tile import Tile
+
+# Radius of tiles worked by a city
+CITY_WORK_RADIUS = 2
 
 
 class ResourceSystem:
@@ -20,6 +25,37 @@ class ResourceSystem:
             game_state: Reference to game state
         """
         self.game_state = game_state
+        self._city_tiles_cache: dict[tuple[int, int, int], list['Tile']] = {}
+        # Grid and Grid.tile_version the cached tiles were read from
+        self._city_tiles_grid: Optional['Grid'] = None
+        self._city_tiles_version = -1
+
+    def get_city_tiles(self, cx: int, cy: int, radius: int = CITY_WORK_RADIUS) -> list['Tile']:
+        """Get the tiles worked by a city, cached per position and radius.
+
+        The cache is dropped when the game's grid is swapped or any of its
+        tiles is replaced or marked dirty.
+
+        Args:
+            cx: City X coordinate
+            cy: City Y coordinate
+            radius: Work radius
+
+        Returns:
+            List of tiles within radius of the city
+        """
+        grid = self.game_state.grid
+        if grid is not self._city_tiles_grid or grid.tile_version != self._city_tiles_version:
+            self._city_tiles_cache.clear()
+            self._city_tiles_grid = grid
+            self._city_tiles_version = grid.tile_version
+
+        key = (cx, cy, radius)
+        tiles = self._city_tiles_cache.get(key)
+        if tiles is None:
+            tiles = grid.get_tiles_in_range(cx, cy, radius)
+            self._city_tiles_cache[key] = tiles
+        return tiles
 
     def calculate_income(self, civ: 'Civilization') -> dict[ResourceType, int]:
         """Calculate per-turn income for a civilization.
@@ -40,8 +76,7 @@ class ResourceSystem:
                 income[resource_type] += amount
 
             # Income from worked tiles
-            worked_tiles = self.game_state.grid.get_tiles_in_range(city.x, city.y, 2)
-            for tile in worked_tiles:
+            for tile in self.get_city_tiles(city.x, city.y):
                 if tile.resource and tile.owner == civ:
                     yield_amount = RESOURCE_YIELDS.get(tile.resource, 0)
                     income[tile.resource] += yield_amount
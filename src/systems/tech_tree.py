@@ -4,8 +4,10 @@ from typing import TYPE_CHECKING, Optional
 
 from src.data.tech_data import (
     Technology,
+    can_research_for_mask,
+    get_bonus_for_mask,
     get_technology,
-    get_available_techs,
+    get_available_techs_for_mask,
     TECHNOLOGIES,
 )
 
@@ -16,6 +18,8 @@ if TYPE_CHECKING:
 class TechTree:
     """Manages technology research for a civilization."""
 
+    __slots__ = ("civ", "_current_tech")
+
     def __init__(self, civ: 'Civilization'):
         """Initialize tech tree.
 
@@ -23,10 +27,27 @@ class TechTree:
             civ: Civilization this tech tree belongs to
         """
         self.civ = civ
+        self._current_tech: Optional[Technology] = None
+
+    def _get_current_tech(self) -> Optional[Technology]:
+        """Get the Technology being researched, cached across calls.
+
+        The cache is checked against the civilization's current research so
+        research started or completed directly on the civ is picked up.
+
+        Returns:
+            Current Technology, or None if not researching
+        """
+        tech_id = self.civ.current_research
+        tech = self._current_tech
+        if tech is None or tech.id != tech_id:
+            tech = get_technology(tech_id) if tech_id is not None else None
+            self._current_tech = tech
+        return tech
 
     @property
-    def researched(self) -> set[str]:
-        """Get set of researched tech IDs."""
+    def researched(self) -> frozenset[str]:
+        """Get the immutable set of researched tech IDs."""
         return self.civ.researched_techs
 
     @property
@@ -45,7 +66,7 @@ class TechTree:
         Returns:
             List of researchable technologies
         """
-        return get_available_techs(self.researched)
+        return get_available_techs_for_mask(self.civ.tech_bits)
 
     def can_research(self, tech_id: str) -> bool:
         """Check if a technology can be researched.
@@ -56,16 +77,7 @@ class TechTree:
         Returns:
             True if can research
         """
-        tech = get_technology(tech_id)
-        if not tech:
-            return False
-
-        # Already researched
-        if tech_id in self.researched:
-            return False
-
-        # Check prerequisites
-        return all(prereq in self.researched for prereq in tech.prerequisites)
+        return can_research_for_mask(tech_id, self.civ.tech_bits)
 
     def start_research(self, tech_id: str) -> bool:
         """Start researching a technology.
@@ -91,18 +103,16 @@ class TechTree:
         Returns:
             Completed tech ID if research finished, None otherwise
         """
-        if self.current_research is None:
-            return None
-
-        tech = get_technology(self.current_research)
-        if not tech:
+        tech = self._get_current_tech()
+        if tech is None:
             return None
 
         self.civ.add_research_progress(amount)
 
         if self.research_progress >= tech.cost:
-            completed_id = self.current_research
+            completed_id = tech.id
             self.civ.research_complete(completed_id)
+            self._current_tech = None
             return completed_id
 
         return None
@@ -113,11 +123,8 @@ class TechTree:
         Returns:
             Progress ratio (0.0 to 1.0)
         """
-        if self.current_research is None:
-            return 0.0
-
-        tech = get_technology(self.current_research)
-        if not tech:
+        tech = self._get_current_tech()
+        if tech is None:
             return 0.0
 
         return min(1.0, self.research_progress / tech.cost)
@@ -131,18 +138,18 @@ class TechTree:
         Returns:
             Estimated turns remaining, or 0 if no research
         """
-        if self.current_research is None:
+        tech = self._get_current_tech()
+        if tech is None:
             return 0
 
-        tech = get_technology(self.current_research)
-        if not tech:
-            return 0
-
-        remaining = tech.cost - self.research_progress
         if research_per_turn <= 0:
             return 999
 
-        return (remaining + research_per_turn - 1) // research_per_turn
+        remaining = tech.cost - self.civ.research_progress
+        if remaining <= 0:
+            return 0
+
+        return -(-remaining // research_per_turn)
 
     def has_tech(self, tech_id: str) -> bool:
         """Check if a technology has been researched.
@@ -164,9 +171,4 @@ class TechTree:
         Returns:
             Total bonus value
         """
-        total = 0.0
-        for tech_id in self.researched:
-            tech = get_technology(tech_id)
-            if tech and bonus_name in tech.bonuses:
-                total += tech.bonuses[bonus_name]
-        return total
+        return get_bonus_for_mask(bonus_name, self.civ.tech_bits)
@@ -2,16 +2,25 @@
 
 import pygame
 from typing import TYPE_CHECKING, Optional, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum, auto
 
-from src.core.settings import WINDOW_WIDTH, WINDOW_HEIGHT, TILE_SIZE
+from src.core.settings import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, TILE_SIZE, INPUT_IDLE_WAIT_MS, CAMERA_EDGE_SCROLL_MARGIN
+)
 
 if TYPE_CHECKING:
     from src.ui.camera import Camera
     from src.core.game_state import GameState
 
 
+# Keys that scroll the camera
+SCROLL_KEYS = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s,
+)
+
+
 class InputAction(Enum):
     """Types of input actions."""
     QUIT = auto()
@@ -24,18 +33,32 @@ class InputAction(Enum):
     CYCLE_UNIT = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class InputEvent:
     """Represents a processed input event."""
     action: InputAction
     world_x: Optional[int] = None
     world_y: Optional[int] = None
-    data: dict = field(default_factory=dict)
+    data: Optional[dict] = None  # None when the event carries no extra data
 
 
 class InputHandler:
     """Handles all user input and translates to game actions."""
 
+    __slots__ = (
+        "camera", "end_turn_button_rect", "hud_top_height", "hud_bottom_height",
+        "_map_y_min", "_map_y_max", "idle_wait_ms", "scrolling", "_last_mouse_pos",
+        "_btn_x0", "_btn_y0", "_btn_x1", "_btn_y1",
+    )
+
+    # Key bindings for actions without a map position
+    _KEY_ACTIONS = {
+        pygame.K_ESCAPE: InputAction.QUIT,
+        pygame.K_SPACE: InputAction.END_TURN,
+        pygame.K_RETURN: InputAction.END_TURN,
+        pygame.K_TAB: InputAction.CYCLE_UNIT,
+    }
+
     def __init__(self, camera: 'Camera'):
         """Initialize input handler.
 
@@ -50,24 +73,48 @@ class InputHandler:
             WINDOW_HEIGHT - 60,
             100, 40
         )
+        self._cache_button_bounds()
 
         # HUD height for determining map clicks
         self.hud_top_height = 40
         self.hud_bottom_height = 80
 
-    def process_events(self, game_state: 'GameState') -> list[InputEvent]:
+        # Map area bounds in screen pixels (inclusive min, exclusive max)
+        self._map_y_min = self.hud_top_height + 1
+        self._map_y_max = WINDOW_HEIGHT - self.hud_bottom_height
+
+        # Idle handling: block for events instead of polling when nothing changes
+        self.idle_wait_ms = INPUT_IDLE_WAIT_MS
+        self.scrolling = False
+        self._last_mouse_pos: Optional[tuple[int, int]] = None
+
+    def process_events(self, game_state: 'GameState', idle: bool = False) -> list[InputEvent]:
         """Process all pending pygame events.
 
+        Mouse motion is coalesced so only the latest position is kept.
+
         Args:
             game_state: Current game state
+            idle: If True and no events are pending, wait up to idle_wait_ms
+                for one instead of returning immediately
 
         Returns:
             List of input events
         """
         events = []
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        raw_events = pygame.event.get()
+        if idle and not raw_events:
+            waited = pygame.event.wait(self.idle_wait_ms)
+            if waited.type != pygame.NOEVENT:
+                raw_events = [waited]
+                raw_events.extend(pygame.event.get())
+
+        for event in raw_events:
+            if event.type == pygame.MOUSEMOTION:
+                self._last_mouse_pos = event.pos
+
+            elif event.type == pygame.QUIT:
                 events.append(InputEvent(action=InputAction.QUIT))
 
             elif event.type == pygame.KEYDOWN:
@@ -93,16 +140,8 @@ class InputHandler:
         Returns:
             Input event or None
         """
-        if event.key == pygame.K_ESCAPE:
-            return InputEvent(action=InputAction.QUIT)
-
-        elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
-            return InputEvent(action=InputAction.END_TURN)
-
-        elif event.key == pygame.K_TAB:
-            return InputEvent(action=InputAction.CYCLE_UNIT)
-
-        return None
+        action = self._KEY_ACTIONS.get(event.key)
+        return InputEvent(action=action) if action else None
 
     def _handle_mousedown(self, event: pygame.event.Event,
                           game_state: 'GameState') -> Optional[InputEvent]:
@@ -119,17 +158,18 @@ class InputHandler:
 
         if event.button == 1:  # Left click
             # Check UI buttons first
-            if self.end_turn_button_rect.collidepoint(mouse_x, mouse_y):
+            if (self._btn_x0 <= mouse_x < self._btn_x1
+                    and self._btn_y0 <= mouse_y < self._btn_y1):
                 return InputEvent(action=InputAction.END_TURN)
 
             # Check if clicking on map (not on HUD)
-            if self._is_map_click(mouse_y):
+            if self._map_y_min <= mouse_y < self._map_y_max:
                 world_x, world_y = self.camera.screen_to_world(mouse_x, mouse_y)
                 return self._determine_map_action(world_x, world_y, game_state)
 
         elif event.button == 3:  # Right click
             # Check if clicking on map
-            if self._is_map_click(mouse_y):
+            if self._map_y_min <= mouse_y < self._map_y_max:
                 world_x, world_y = self.camera.screen_to_world(mouse_x, mouse_y)
 
                 # Right click with selected unit = move/attack
@@ -140,17 +180,6 @@ class InputHandler:
 
         return None
 
-    def _is_map_click(self, screen_y: int) -> bool:
-        """Check if click is on the map area.
-
-        Args:
-            screen_y: Y coordinate of click
-
-        Returns:
-            True if click is on map
-        """
-        return self.hud_top_height < screen_y < WINDOW_HEIGHT - self.hud_bottom_height
-
     def _determine_map_action(self, world_x: int, world_y: int,
                               game_state: 'GameState') -> Optional[InputEvent]:
         """Determine action for a left click on the map.
@@ -167,27 +196,30 @@ class InputHandler:
         if tile is None:
             return None
 
+        unit = tile.unit
+        selected = game_state.selected_unit
+
         # Check if clicking on a unit
-        if tile.unit:
+        if unit:
             # If it's our unit, select it
-            if tile.unit.owner == game_state.player_civ:
+            if unit.owner == game_state.player_civ:
                 return InputEvent(
                     action=InputAction.SELECT_TILE,
                     world_x=world_x,
                     world_y=world_y,
-                    data={"unit": tile.unit}
+                    data={"unit": unit}
                 )
             # If it's enemy and we have selected unit, attack
-            elif game_state.selected_unit:
+            elif selected:
                 return InputEvent(
                     action=InputAction.ATTACK,
                     world_x=world_x,
                     world_y=world_y,
-                    data={"target": tile.unit}
+                    data={"target": unit}
                 )
 
         # If we have a selected unit, try to move
-        if game_state.selected_unit:
+        if selected:
             return InputEvent(
                 action=InputAction.MOVE_UNIT,
                 world_x=world_x,
@@ -217,15 +249,15 @@ class InputHandler:
         if tile is None:
             return None
 
-        selected = game_state.selected_unit
+        unit = tile.unit
 
         # Check if target tile has enemy unit
-        if tile.unit and tile.unit.owner != selected.owner:
+        if unit and unit.owner != game_state.selected_unit.owner:
             return InputEvent(
                 action=InputAction.ATTACK,
                 world_x=world_x,
                 world_y=world_y,
-                data={"target": tile.unit}
+                data={"target": unit}
             )
 
         # Otherwise try to move
@@ -240,24 +272,37 @@ class InputHandler:
 
         This should be called each frame.
         """
+        camera_pos = (self.camera.x, self.camera.y)
+
         # Handle keyboard camera scrolling
         keys = pygame.key.get_pressed()
-        keys_dict = {
-            pygame.K_LEFT: keys[pygame.K_LEFT],
-            pygame.K_RIGHT: keys[pygame.K_RIGHT],
-            pygame.K_UP: keys[pygame.K_UP],
-            pygame.K_DOWN: keys[pygame.K_DOWN],
-            pygame.K_a: keys[pygame.K_a],
-            pygame.K_d: keys[pygame.K_d],
-            pygame.K_w: keys[pygame.K_w],
-            pygame.K_s: keys[pygame.K_s],
-        }
-        self.camera.handle_key_scroll(keys_dict)
-
-        # Handle edge scrolling
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        if self._is_map_click(mouse_y):
-            self.camera.handle_edge_scroll(mouse_x, mouse_y)
+        if any(keys[k] for k in SCROLL_KEYS):
+            self.camera.handle_key_scroll({k: keys[k] for k in SCROLL_KEYS})
+
+        # Handle edge scrolling, using the latest position from mouse motion
+        if self._last_mouse_pos is not None:
+            mouse_x, mouse_y = self._last_mouse_pos
+            if self._map_y_min <= mouse_y < self._map_y_max and self._is_near_edge(mouse_x, mouse_y):
+                self.camera.handle_edge_scroll(mouse_x, mouse_y)
+
+        self.scrolling = (self.camera.x, self.camera.y) != camera_pos
+
+    def _is_near_edge(self, mouse_x: int, mouse_y: int) -> bool:
+        """Check if the mouse is within the edge-scroll margin of the viewport.
+
+        Args:
+            mouse_x: Mouse X position
+            mouse_y: Mouse Y position
+
+        Returns:
+            True if edge scrolling could apply
+        """
+        return (
+            mouse_x < CAMERA_EDGE_SCROLL_MARGIN
+            or mouse_x > self.camera.viewport_width - CAMERA_EDGE_SCROLL_MARGIN
+            or mouse_y < CAMERA_EDGE_SCROLL_MARGIN
+            or mouse_y > self.camera.viewport_height - CAMERA_EDGE_SCROLL_MARGIN
+        )
 
     def update_button_rects(self, end_turn_rect: pygame.Rect) -> None:
         """Update UI button rectangles for hit detection.
@@ -266,3 +311,10 @@ class InputHandler:
             end_turn_rect: Rectangle of the end turn button
         """
         self.end_turn_button_rect = end_turn_rect
+        self._cache_button_bounds()
+
+    def _cache_button_bounds(self) -> None:
+        """Cache the end turn button edges as plain ints for hit testing."""
+        rect = self.end_turn_button_rect
+        self._btn_x0, self._btn_y0 = rect.x, rect.y
+        self._btn_x1, self._btn_y1 = rect.x + rect.w, rect.y + rect.h
@@ -1,9 +1,13 @@
 """Renderer for drawing the game world and UI."""
 
 import pygame
-from typing import Optional, TYPE_CHECKING
+import pygame.freetype
+from functools import lru_cache
+from typing import Iterable, Optional, TYPE_CHECKING
 
-from src.core.settings import TILE_SIZE, COLORS, WINDOW_WIDTH, WINDOW_HEIGHT
+from src.core.settings import (
+    TILE_SIZE, COLORS, WINDOW_WIDTH, WINDOW_HEIGHT, FOG_UNEXPLORED, FOG_EXPLORED
+)
 from src.map.tile import TerrainType, ResourceType
 
 if TYPE_CHECKING:
@@ -13,6 +17,10 @@ if TYPE_CHECKING:
     from src.entities.civilization import Civilization
 
 
+# Default-font point sizes matching the previous pygame.font sizes 24 and 18
+FONT_SIZE = 16
+SMALL_FONT_SIZE = 12
+
 # Map terrain types to colors
 TERRAIN_COLORS = {
     TerrainType.GRASS: COLORS["GRASS"],
@@ -31,10 +39,26 @@ RESOURCE_COLORS = {
     ResourceType.GOLD: COLORS["GOLD"],
 }
 
+# Palettes indexed by enum value; auto() values run contiguously from 1, so
+# slot 0 is padding and member order gives the index
+TERRAIN_COLORS_ARR = [COLORS["GRASS"]] + [
+    TERRAIN_COLORS.get(t, COLORS["GRASS"]) for t in TerrainType
+]
+RESOURCE_COLORS_ARR = [COLORS["WHITE"]] + [
+    RESOURCE_COLORS.get(r, COLORS["WHITE"]) for r in ResourceType
+]
+
 
 class Renderer:
     """Handles all game rendering."""
 
+    __slots__ = (
+        "screen", "font", "small_font", "_render_cached", "_render_small_cached",
+        "_terrain_cache", "_cache_grid", "_fog_explored_surf", "_hud_bg",
+        "_unit_sprite_cache", "_selection_sprite", "_visible_cells", "_visible_key",
+        "_fog_cells", "_fog_window", "_fog_buckets",
+    )
+
     def __init__(self, screen: pygame.Surface):
         """Initialize the renderer.
 
@@ -46,78 +70,217 @@ class Renderer:
         self.small_font = None
         self._init_fonts()
 
+        # Static terrain layer for the whole map, rebuilt only when the grid changes
+        self._terrain_cache: Optional[pygame.Surface] = None
+        self._cache_grid: Optional['Grid'] = None
+
+        # Shared overlay for explored but not currently visible tiles
+        self._fog_explored_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        self._fog_explored_surf.fill((*COLORS["FOG_EXPLORED"], 128))
+
+        # Static HUD bars (top, bottom), built on first render_hud
+        self._hud_bg: Optional[tuple[pygame.Surface, pygame.Surface]] = None
+
+        # Pre-composed unit sprites keyed by (owner color, indicator)
+        self._unit_sprite_cache: dict[tuple[tuple, str], pygame.Surface] = {}
+        self._selection_sprite: Optional[pygame.Surface] = None
+
+        # Visible tile screen rects, reused while the camera is still
+        self._visible_cells: list[pygame.Rect] = []
+        self._visible_key: Optional[tuple] = None
+
+        # Fog buckets from the last frame, keyed by the visible fog window
+        self._fog_cells: Optional[list] = None
+        self._fog_window = b""
+        self._fog_buckets: tuple[list[pygame.Rect], list[pygame.Rect]] = ([], [])
+
     def _init_fonts(self) -> None:
         """Initialize fonts for text rendering."""
-        pygame.font.init()
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        pygame.freetype.init()
+        self.font = pygame.freetype.Font(None, FONT_SIZE)
+        self.small_font = pygame.freetype.Font(None, SMALL_FONT_SIZE)
+
+        # Rendered text surfaces keyed by (text, color), bound per instance
+        self._render_cached = lru_cache(maxsize=256)(
+            lambda text, color: self.font.render(text, color)[0]
+        )
+        self._render_small_cached = lru_cache(maxsize=32)(
+            lambda text, color: self.small_font.render(text, color)[0]
+        )
 
     def clear(self) -> None:
         """Clear the screen."""
         self.screen.fill(COLORS["BLACK"])
 
     def render_grid(self, grid: 'Grid', camera: 'Camera',
-                    fog_state: Optional[dict] = None) -> None:
+                    fog_grid: Optional[bytearray] = None) -> None:
         """Render the tile grid.
 
         Args:
             grid: The game grid to render
             camera: Camera for viewport positioning
-            fog_state: Optional fog of war state dict {(x,y): "UNEXPLORED"|"EXPLORED"|"VISIBLE"}
+            fog_grid: Optional fog of war byte grid of FOG_* values, indexed by y * width + x
         """
+        self._update_terrain_cache(grid)
+
         min_x, min_y, max_x, max_y = camera.get_visible_tile_range()
 
-        for y in range(min_y, max_y):
-            for x in range(min_x, max_x):
-                tile = grid.get_tile(x, y)
-                if tile is not None:
-                    self._render_tile(tile, camera, fog_state)
+        # Clamp to the grid so every enumerated cell is in bounds
+        min_x = max(min_x, 0)
+        min_y = max(min_y, 0)
+        max_x = min(max_x, grid.width)
+        max_y = min(max_y, grid.height)
+
+        # Blit the visible part of the cached terrain layer in one call
+        area = pygame.Rect(
+            min_x * TILE_SIZE,
+            min_y * TILE_SIZE,
+            (max_x - min_x) * TILE_SIZE,
+            (max_y - min_y) * TILE_SIZE,
+        )
+        self.screen.blit(self._terrain_cache, camera.world_to_screen(min_x, min_y), area)
+
+        if fog_grid is None:
+            return
 
-    def _render_tile(self, tile: 'Tile', camera: 'Camera',
-                     fog_state: Optional[dict] = None) -> None:
-        """Render a single tile.
+        # Snapshot the visible fog window with row slices (native copies);
+        # the per-tile bucketing below only reruns when the window changes
+        width = grid.width
+        cells = self._get_visible_cells(camera, min_x, min_y, max_x, max_y)
+        window = b"".join(
+            fog_grid[y * width + min_x:y * width + max_x] for y in range(min_y, max_y)
+        )
+        if cells is not self._fog_cells or window != self._fog_window:
+            # Bucket fogged tiles by state so each pass is a tight same-color loop
+            unexplored = []
+            explored = []
+            for rect, fog in zip(cells, window):
+                if fog == FOG_UNEXPLORED:
+                    unexplored.append(rect)
+                elif fog == FOG_EXPLORED:
+                    explored.append(rect)
+            self._fog_buckets = (unexplored, explored)
+            self._fog_cells = cells
+            self._fog_window = window
+        unexplored, explored = self._fog_buckets
+
+        self._render_fog(unexplored, explored)
+
+    def _get_visible_cells(self, camera: 'Camera', min_x: int, min_y: int,
+                           max_x: int, max_y: int) -> list[pygame.Rect]:
+        """Get screen rects of the visible tiles.
+
+        The enumeration is rebuilt only when the camera offset or range changes.
 
         Args:
-            tile: The tile to render
             camera: Camera for position conversion
-            fog_state: Optional fog of war state
+            min_x, min_y, max_x, max_y: Visible tile range
+
+        Returns:
+            List of screen rects in row-major order
         """
-        screen_x, screen_y = camera.world_to_screen(tile.x, tile.y)
-        rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
+        offset_x, offset_y = camera.world_to_screen(0, 0)
+        key = (offset_x, offset_y, min_x, min_y, max_x, max_y)
+        if key != self._visible_key:
+            self._visible_cells = [
+                pygame.Rect(x * TILE_SIZE + offset_x, y * TILE_SIZE + offset_y,
+                            TILE_SIZE, TILE_SIZE)
+                for y in range(min_y, max_y)
+                for x in range(min_x, max_x)
+            ]
+            self._visible_key = key
+        return self._visible_cells
+
+    def _update_terrain_cache(self, grid: 'Grid') -> None:
+        """Build or patch the cached terrain layer for a grid.
 
-        # Check fog of war state
-        fog = None
-        if fog_state is not None:
-            fog = fog_state.get((tile.x, tile.y), "UNEXPLORED")
+        Args:
+            grid: The game grid being rendered
+        """
+        if self._terrain_cache is None or self._cache_grid is not grid:
+            surface = pygame.Surface((grid.width * TILE_SIZE, grid.height * TILE_SIZE))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self._draw_terrain_tiles(surface, grid.all_tiles())
+            self._terrain_cache = surface
+            self._cache_grid = grid
+        elif grid.dirty_tiles:
+            dirty = (grid.get_tile(x, y) for x, y in grid.dirty_tiles)
+            self._draw_terrain_tiles(self._terrain_cache, [t for t in dirty if t is not None])
+        grid.dirty_tiles.clear()
+
+    def _draw_terrain_tiles(self, surface: pygame.Surface, tiles: Iterable['Tile']) -> None:
+        """Draw tiles' terrain, resources and grid lines onto the terrain layer.
+
+        Rects are bucketed by color so each color is filled in one pass.
 
-        if fog == "UNEXPLORED":
-            # Don't render anything for unexplored tiles
-            pygame.draw.rect(self.screen, COLORS["FOG_UNEXPLORED"], rect)
-            return
+        Args:
+            surface: Terrain layer surface in world pixel coordinates
+            tiles: Tiles to draw
+        """
+        terrain_rects: dict[tuple, list[pygame.Rect]] = {}
+        resource_rects: dict[tuple, list[pygame.Rect]] = {}
+        tile_rects = []
+
+        for tile in tiles:
+            pixel_x = tile.x * TILE_SIZE
+            pixel_y = tile.y * TILE_SIZE
+            rect = pygame.Rect(pixel_x, pixel_y, TILE_SIZE, TILE_SIZE)
+            tile_rects.append(rect)
+
+            # Terrain
+            terrain_rects.setdefault(TERRAIN_COLORS_ARR[tile.terrain.value], []).append(rect)
+
+            # Resource indicator if present
+            resource = tile.resource
+            if resource is not None:
+                resource_rects.setdefault(RESOURCE_COLORS_ARR[resource.value], []).append(
+                    pygame.Rect(pixel_x + TILE_SIZE - 10, pixel_y + 2, 8, 8)
+                )
+
+        fill = surface.fill
+        for color, rects in terrain_rects.items():
+            for rect in rects:
+                fill(color, rect)
+        for color, rects in resource_rects.items():
+            for rect in rects:
+                fill(color, rect)
+
+        # Grid lines
+        self._draw_grid_lines(surface, tile_rects)
+
+    @staticmethod
+    def _draw_grid_lines(surface: pygame.Surface, rects: list[pygame.Rect]) -> None:
+        """Draw tile borders in a single-color pass.
 
-        # Render terrain
-        color = TERRAIN_COLORS.get(tile.terrain, COLORS["GRASS"])
-        pygame.draw.rect(self.screen, color, rect)
-
-        # Render resource indicator if present
-        if tile.resource is not None:
-            resource_color = RESOURCE_COLORS.get(tile.resource, COLORS["WHITE"])
-            resource_rect = pygame.Rect(
-                screen_x + TILE_SIZE - 10,
-                screen_y + 2,
-                8, 8
-            )
-            pygame.draw.rect(self.screen, resource_color, resource_rect)
-
-        # Apply fog overlay for explored but not visible tiles
-        if fog == "EXPLORED":
-            fog_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-            fog_surface.set_alpha(128)
-            fog_surface.fill(COLORS["FOG_EXPLORED"])
-            self.screen.blit(fog_surface, (screen_x, screen_y))
-
-        # Draw grid lines
-        pygame.draw.rect(self.screen, COLORS["DARK_GRAY"], rect, 1)
+        Args:
+            surface: Surface to draw on
+            rects: Tile rects to outline
+        """
+        draw_rect = pygame.draw.rect
+        line_color = COLORS["DARK_GRAY"]
+        for rect in rects:
+            draw_rect(surface, line_color, rect, 1)
+
+    def _render_fog(self, unexplored: list[pygame.Rect], explored: list[pygame.Rect]) -> None:
+        """Render the fog of war overlay for non-visible tiles.
+
+        Args:
+            unexplored: Screen rects of unexplored tiles
+            explored: Screen rects of explored but not visible tiles
+        """
+        # Don't render anything for unexplored tiles. draw.rect rather than
+        # Surface.fill, which mis-clips rects that start above the screen.
+        screen = self.screen
+        draw_rect = pygame.draw.rect
+        unexplored_color = COLORS["FOG_UNEXPLORED"]
+        for rect in unexplored:
+            draw_rect(screen, unexplored_color, rect)
+
+        # Apply fog overlay for explored tiles, keeping grid lines on top
+        fog_surf = self._fog_explored_surf
+        self.screen.blits([(fog_surf, rect) for rect in explored], False)
+        self._draw_grid_lines(self.screen, explored)
 
     def render_unit(self, unit, camera: 'Camera', selected: bool = False) -> None:
         """Render a unit on the map.
@@ -129,23 +292,10 @@ class Renderer:
         """
         screen_x, screen_y = camera.world_to_screen(unit.x, unit.y)
 
-        # Unit body (colored rectangle based on owner)
-        unit_rect = pygame.Rect(
-            screen_x + 4,
-            screen_y + 4,
-            TILE_SIZE - 8,
-            TILE_SIZE - 8
-        )
-
-        # Get civilization color
+        # Unit body and type indicator from the sprite cache
         civ_color = COLORS.get(unit.owner.color_key, COLORS["WHITE"]) if unit.owner else COLORS["WHITE"]
-        pygame.draw.rect(self.screen, civ_color, unit_rect)
-
-        # Draw unit type indicator (M for melee, R for ranged)
         indicator = "M" if unit.range == 1 else "R"
-        text = self.small_font.render(indicator, True, COLORS["WHITE"])
-        text_rect = text.get_rect(center=(screen_x + TILE_SIZE // 2, screen_y + TILE_SIZE // 2))
-        self.screen.blit(text, text_rect)
+        self.screen.blit(self._get_unit_sprite(civ_color, indicator), (screen_x, screen_y))
 
         # Health bar
         health_ratio = unit.health / unit.max_health
@@ -167,8 +317,50 @@ class Renderer:
 
         # Selection indicator
         if selected:
-            select_rect = pygame.Rect(screen_x + 2, screen_y + 2, TILE_SIZE - 4, TILE_SIZE - 4)
-            pygame.draw.rect(self.screen, COLORS["SELECTED"], select_rect, 2)
+            self.screen.blit(self._get_selection_sprite(), (screen_x, screen_y))
+
+    def _get_unit_sprite(self, civ_color: tuple, indicator: str) -> pygame.Surface:
+        """Get the pre-composed body and indicator sprite for a unit.
+
+        Args:
+            civ_color: Owner's color
+            indicator: Unit type indicator text ("M" or "R")
+
+        Returns:
+            TILE_SIZE square sprite with a transparent border
+        """
+        key = (civ_color, indicator)
+        sprite = self._unit_sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+
+            # Unit body (colored rectangle based on owner)
+            pygame.draw.rect(sprite, civ_color, pygame.Rect(4, 4, TILE_SIZE - 8, TILE_SIZE - 8))
+
+            # Unit type indicator (M for melee, R for ranged)
+            text = self._render_small_cached(indicator, COLORS["WHITE"])
+            sprite.blit(text, text.get_rect(center=(TILE_SIZE // 2, TILE_SIZE // 2)))
+
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._unit_sprite_cache[key] = sprite
+        return sprite
+
+    def _get_selection_sprite(self) -> pygame.Surface:
+        """Get the selection outline sprite, drawn over a unit's health bar.
+
+        Returns:
+            TILE_SIZE square sprite with only the outline opaque
+        """
+        sprite = self._selection_sprite
+        if sprite is None:
+            sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            select_rect = pygame.Rect(2, 2, TILE_SIZE - 4, TILE_SIZE - 4)
+            pygame.draw.rect(sprite, COLORS["SELECTED"], select_rect, 2)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._selection_sprite = sprite
+        return sprite
 
     def render_city(self, city, camera: 'Camera') -> None:
         """Render a city on the map.
@@ -192,7 +384,7 @@ class Renderer:
         pygame.draw.rect(self.screen, COLORS["WHITE"], city_rect, 2)
 
         # City icon (C)
-        text = self.font.render("C", True, COLORS["WHITE"])
+        text = self._render_cached("C", COLORS["WHITE"])
         text_rect = text.get_rect(center=(screen_x + TILE_SIZE // 2, screen_y + TILE_SIZE // 2))
         self.screen.blit(text, text_rect)
 
@@ -206,38 +398,52 @@ class Renderer:
             current_civ_name: Name of the current civilization
             selected_unit: Currently selected unit (if any)
         """
+        if self._hud_bg is None:
+            self._hud_bg = self._build_hud_background()
+        top_bar, bottom_bar = self._hud_bg
+
         # Top bar background
-        top_bar = pygame.Rect(0, 0, WINDOW_WIDTH, 40)
-        pygame.draw.rect(self.screen, COLORS["HUD_BG"], top_bar)
+        self.screen.blit(top_bar, (0, 0))
 
         # Turn and civilization info
-        turn_text = self.font.render(f"Turn: {current_turn}  |  {current_civ_name}", True, COLORS["WHITE"])
+        turn_text = self._render_cached(f"Turn: {current_turn}  |  {current_civ_name}", COLORS["WHITE"])
         self.screen.blit(turn_text, (10, 10))
 
-        # Resources
-        x_offset = 300
-        for resource_name, amount in resources.items():
-            resource_text = self.font.render(f"{resource_name}: {amount}", True, COLORS["WHITE"])
-            self.screen.blit(resource_text, (x_offset, 10))
-            x_offset += 120
+        # Resources, rendered as a single line
+        resource_line = "   ".join(f"{name}: {amount}" for name, amount in resources.items())
+        self.screen.blit(self._render_cached(resource_line, COLORS["WHITE"]), (300, 10))
 
-        # Bottom bar background
-        bottom_bar = pygame.Rect(0, WINDOW_HEIGHT - 80, WINDOW_WIDTH, 80)
-        pygame.draw.rect(self.screen, COLORS["HUD_BG"], bottom_bar)
+        # Bottom bar background with the End Turn button
+        self.screen.blit(bottom_bar, (0, WINDOW_HEIGHT - 80))
 
         # Selected unit info
         if selected_unit is not None:
             unit_info = f"{selected_unit.name}  HP: {selected_unit.health}/{selected_unit.max_health}  Moves: {selected_unit.remaining_movement}/{selected_unit.movement}"
-            unit_text = self.font.render(unit_info, True, COLORS["WHITE"])
+            unit_text = self._render_cached(unit_info, COLORS["WHITE"])
             self.screen.blit(unit_text, (10, WINDOW_HEIGHT - 70))
 
             # Unit stats
             stats_text = f"ATK: {selected_unit.attack}  DEF: {selected_unit.defense}  Range: {selected_unit.range}"
-            stats_render = self.font.render(stats_text, True, COLORS["WHITE"])
+            stats_render = self._render_cached(stats_text, COLORS["WHITE"])
             self.screen.blit(stats_render, (10, WINDOW_HEIGHT - 45))
 
-        # End turn button
-        self.render_button("End Turn", WINDOW_WIDTH - 120, WINDOW_HEIGHT - 60, 100, 40)
+    def _build_hud_background(self) -> tuple[pygame.Surface, pygame.Surface]:
+        """Compose the static HUD bars, including the End Turn button.
+
+        Returns:
+            Tuple of (top bar, bottom bar) surfaces
+        """
+        top_bar = pygame.Surface((WINDOW_WIDTH, 40))
+        top_bar.fill(COLORS["HUD_BG"])
+
+        bottom_bar = pygame.Surface((WINDOW_WIDTH, 80))
+        bottom_bar.fill(COLORS["HUD_BG"])
+        self._draw_button(bottom_bar, "End Turn", pygame.Rect(WINDOW_WIDTH - 120, 20, 100, 40))
+
+        if pygame.display.get_surface() is not None:
+            top_bar = top_bar.convert()
+            bottom_bar = bottom_bar.convert()
+        return top_bar, bottom_bar
 
     def render_button(self, text: str, x: int, y: int, width: int, height: int,
                       hover: bool = False) -> pygame.Rect:
@@ -253,15 +459,26 @@ class Renderer:
             Button rect for hit detection
         """
         rect = pygame.Rect(x, y, width, height)
+        self._draw_button(self.screen, text, rect, hover)
+        return rect
+
+    def _draw_button(self, surface: pygame.Surface, text: str, rect: pygame.Rect,
+                     hover: bool = False) -> None:
+        """Draw a button's body, border and label onto a surface.
+
+        Args:
+            surface: Surface to draw on
+            text: Button text
+            rect: Button rect on the surface
+            hover: Whether mouse is hovering
+        """
         color = COLORS["BUTTON_HOVER"] if hover else COLORS["BUTTON"]
-        pygame.draw.rect(self.screen, color, rect)
-        pygame.draw.rect(self.screen, COLORS["WHITE"], rect, 2)
+        pygame.draw.rect(surface, color, rect)
+        pygame.draw.rect(surface, COLORS["WHITE"], rect, 2)
 
-        text_surface = self.font.render(text, True, COLORS["WHITE"])
+        text_surface = self._render_cached(text, COLORS["WHITE"])
         text_rect = text_surface.get_rect(center=rect.center)
-        self.screen.blit(text_surface, text_rect)
-
-        return rect
+        surface.blit(text_surface, text_rect)
 
     def render_text(self, text: str, x: int, y: int,
                     color: tuple = None, centered: bool = False) -> None:
@@ -276,9 +493,10 @@ class Renderer:
         if color is None:
             color = COLORS["WHITE"]
 
-        text_surface = self.font.render(text, True, color)
+        # One-off text is drawn straight onto the screen without a Surface
         if centered:
-            text_rect = text_surface.get_rect(center=(x, y))
-            self.screen.blit(text_surface, text_rect)
+            text_rect = self.font.get_rect(text)
+            text_rect.center = (x, y)
+            self.font.render_to(self.screen, text_rect, text, color)
         else:
-            self.screen.blit(text_surface, (x, y))
+            self.font.render_to(self.screen, (x, y), text, color)
@@ -0,0 +1,71 @@
+"""Lightweight stand-ins for game objects used by the tests."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.map.grid import Grid
+
+if TYPE_CHECKING:
+    from src.entities.city import City
+    from src.entities.civilization import Civilization
+    from src.entities.unit import Unit
+
+
+@dataclass
+class FakeGameState:
+    """Plain game state exposing the interface the AI reads and mutates."""
+
+    grid: Grid
+    active_civs: list['Civilization'] = field(default_factory=list)
+    units: list['Unit'] = field(default_factory=list)
+    cities: list['City'] = field(default_factory=list)
+
+    def add_unit(self, unit: 'Unit') -> None:
+        """Add a unit and place it on its tile."""
+        self.units.append(unit)
+        tile = self.grid.get_tile(unit.x, unit.y)
+        if tile:
+            tile.unit = unit
+
+    def remove_unit(self, unit: 'Unit') -> None:
+        """Remove a unit and clear its tile."""
+        if unit in self.units:
+            self.units.remove(unit)
+        tile = self.grid.get_tile(unit.x, unit.y)
+        if tile and tile.unit is unit:
+            tile.unit = None
+
+    def add_city(self, city: 'City') -> None:
+        """Add a city."""
+        self.cities.append(city)
+
+    def get_units_for_civ(self, civ: 'Civilization') -> list['Unit']:
+        """Get units owned by a civilization."""
+        return [u for u in self.units if u.owner == civ]
+
+    def get_cities_for_civ(self, civ: 'Civilization') -> list['City']:
+        """Get cities owned by a civilization."""
+        return [c for c in self.cities if c.owner == civ]
+
+    def get_all_units(self) -> list['Unit']:
+        """Get every unit."""
+        return list(self.units)
+
+    def get_all_cities(self) -> list['City']:
+        """Get every city."""
+        return list(self.cities)
+
+    def move_unit(self, unit: 'Unit', new_x: int, new_y: int, cost: int) -> bool:
+        """Move a unit, mirroring GameState.move_unit."""
+        old_tile = self.grid.get_tile(unit.x, unit.y)
+        new_tile = self.grid.get_tile(new_x, new_y)
+
+        if not new_tile or not new_tile.can_enter(unit):
+            return False
+        if not unit.move_to(new_x, new_y, cost):
+            return False
+
+        if old_tile and old_tile.unit is unit:
+            old_tile.unit = None
+        new_tile.unit = unit
+        return True
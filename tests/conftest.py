@@ -1,5 +1,7 @@
 """Pytest fixtures with real game data."""
 
+import copy
+
 import pytest
 
 from src.map.grid import Grid
@@ -10,7 +12,10 @@ from src.core.settings import MAP_WIDTH, MAP_HEIGHT
 
 @pytest.fixture
 def map_generator():
-    """Create a map generator with a fixed seed for reproducibility."""
+    """Create a map generator with a fixed seed for reproducibility.
+
+    Function scoped: the generator's RNG advances with every use.
+    """
     return MapGenerator(seed=12345)
 
 
@@ -26,20 +31,52 @@ def standard_grid():
     return Grid(MAP_WIDTH, MAP_HEIGHT)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def generated_map():
-    """Create a fully generated map with terrain and resources."""
+    """Create a fully generated map with terrain and resources.
+
+    Session scoped since the seed is fixed; tests must not mutate it.
+    """
     generator = MapGenerator(seed=12345)
     return generator.generate_map(MAP_WIDTH, MAP_HEIGHT)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def game_map_with_positions():
-    """Create a game map with starting positions for 3 civs."""
+    """Create a game map with starting positions for 3 civs.
+
+    Session scoped since the seed is fixed; tests must not mutate it.
+    """
     grid, positions = generate_game_map(MAP_WIDTH, MAP_HEIGHT, num_civs=3, seed=12345)
     return grid, positions
 
 
+@pytest.fixture(scope="session")
+def _game_map_prototypes():
+    """Cache of generated (grid, positions) keyed by generation arguments."""
+    return {}
+
+
+@pytest.fixture
+def generated_game_map(_game_map_prototypes):
+    """Get a factory with generate_game_map's signature for tests that mutate the map.
+
+    Each distinct set of arguments is generated once per session; every call
+    returns a deep copy, so units and cities placed by one test never leak
+    into another.
+    """
+    def factory(width: int, height: int, num_civs: int, seed: int):
+        key = (width, height, num_civs, seed)
+        prototype = _game_map_prototypes.get(key)
+        if prototype is None:
+            prototype = _game_map_prototypes[key] = generate_game_map(
+                width, height, num_civs, seed=seed
+            )
+        return copy.deepcopy(prototype)
+
+    return factory
+
+
 @pytest.fixture
 def grass_tile():
     """Create a grass tile at origin."""
@@ -4,14 +4,16 @@ import pytest
 from unittest.mock import MagicMock
 
 from src.ai.ai_controller import AIController, create_ai_controller
-from src.ai.ai_tactics import TacticalAI, ActionType
+from src.ai.ai_tactics import TacticalAI, TacticalAction, ActionType
 from src.ai.ai_strategies import StrategicAI, StrategicGoal
 from src.ai.utility_functions import (
     calculate_attack_utility,
+    calculate_attack_utility_batch,
     calculate_movement_utility,
     calculate_retreat_utility,
     calculate_production_utility,
     calculate_research_utility,
+    get_enemy_positions,
 )
 from src.entities.civilization import Civilization
 from src.entities.unit_types import create_warrior, create_archer, create_spearman
@@ -19,6 +21,7 @@ from src.entities.city import City
 from src.map.tile import Tile, TerrainType
 from src.map.grid import Grid
 from src.core.settings import AI_PERSONALITIES
+from tests._fakes import FakeGameState
 
 
 @pytest.fixture
@@ -51,15 +54,8 @@ def small_grid():
 
 @pytest.fixture
 def mock_game_state(small_grid, player_civ, aggressive_civ):
-    """Create mock game state for testing."""
-    game_state = MagicMock()
-    game_state.grid = small_grid
-    game_state.active_civs = [player_civ, aggressive_civ]
-    game_state.get_units_for_civ = MagicMock(return_value=[])
-    game_state.get_cities_for_civ = MagicMock(return_value=[])
-    game_state.get_all_units = MagicMock(return_value=[])
-    game_state.get_all_cities = MagicMock(return_value=[])
-    return game_state
+    """Create a fake game state for testing."""
+    return FakeGameState(grid=small_grid, active_civs=[player_civ, aggressive_civ])
 
 
 class TestUtilityFunctions:
@@ -113,12 +109,96 @@ class TestUtilityFunctions:
         # Killing a weak unit should be more attractive
         assert utility_weak > utility_healthy
 
+    def test_attack_utility_cache_tracks_health(self, player_civ, aggressive_civ):
+        """Test cached attack utility follows health changes on the same units."""
+        attacker = create_warrior(aggressive_civ, 0, 0)
+        defender = create_archer(player_civ, 1, 0)
+        defender_tile = Tile(x=1, y=0, terrain=TerrainType.GRASS)
+        weights = AI_PERSONALITIES["BALANCED"]
+
+        healthy = calculate_attack_utility(attacker, defender, defender_tile, weights)
+        assert calculate_attack_utility(attacker, defender, defender_tile, weights) == healthy
+
+        defender.health = 5
+        assert calculate_attack_utility(attacker, defender, defender_tile, weights) > healthy
+
+    def test_attack_utility_batch_matches_single(self, player_civ, aggressive_civ):
+        """Test batch attack scoring equals scoring each target separately."""
+        attacker = create_archer(aggressive_civ, 2, 2)
+        defenders = [
+            create_warrior(player_civ, 3, 2),
+            create_spearman(player_civ, 2, 4),
+            create_archer(player_civ, 1, 2),
+        ]
+        defenders[2].health = 5
+        tiles = [
+            Tile(x=3, y=2, terrain=TerrainType.GRASS),
+            Tile(x=2, y=4, terrain=TerrainType.FOREST),
+            Tile(x=1, y=2, terrain=TerrainType.MOUNTAIN),
+        ]
+        weights = AI_PERSONALITIES["AGGRESSIVE"]
+
+        assert calculate_attack_utility_batch(attacker, defenders, tiles, weights) == [
+            calculate_attack_utility(attacker, defender, tile, weights)
+            for defender, tile in zip(defenders, tiles)
+        ]
+
+    def test_attack_utility_batch_shares_cache(self, player_civ, aggressive_civ):
+        """Test batch scoring reuses and fills the single-target utility cache."""
+        from unittest.mock import patch
+        from src.systems.combat_system import CombatSystem
+
+        # Unusual health values keep the keys clear of entries from other tests
+        attacker = create_warrior(aggressive_civ, 2, 2)
+        attacker.health = 37
+        defenders = [create_warrior(player_civ, 3, 2), create_spearman(player_civ, 2, 3)]
+        defenders[0].health = 23
+        defenders[1].health = 19
+        tiles = [
+            Tile(x=3, y=2, terrain=TerrainType.HILLS),
+            Tile(x=2, y=3, terrain=TerrainType.HILLS),
+        ]
+        weights = AI_PERSONALITIES["BALANCED"]
+
+        first = calculate_attack_utility(attacker, defenders[0], tiles[0], weights)
+        odds = CombatSystem.calculate_odds_matrix
+        with patch.object(CombatSystem, 'calculate_odds_matrix', wraps=odds) as matrix:
+            batch = calculate_attack_utility_batch(attacker, defenders, tiles, weights)
+            assert batch[0] == first
+            assert matrix.call_args.args[1] == [defenders[1]]
+
+            assert calculate_attack_utility_batch(attacker, defenders, tiles, weights) == batch
+            assert matrix.call_count == 1
+
+    def test_personality_record_matches_dict(self, player_civ, aggressive_civ):
+        """Test utilities score the same for dict and record personality weights."""
+        from src.core.settings import AI_PERSONALITY_WEIGHTS
+        from src.data.unit_data import UnitType
+
+        attacker = create_warrior(aggressive_civ, 0, 0)
+        defender = create_archer(player_civ, 1, 0)
+        defender_tile = Tile(x=1, y=0, terrain=TerrainType.GRASS)
+        city = City(name="Test City", owner=aggressive_civ, x=5, y=5)
+
+        as_dict = AI_PERSONALITIES["AGGRESSIVE"]
+        as_record = AI_PERSONALITY_WEIGHTS["AGGRESSIVE"]
+
+        assert calculate_attack_utility(
+            attacker, defender, defender_tile, as_dict
+        ) == calculate_attack_utility(attacker, defender, defender_tile, as_record)
+        assert calculate_production_utility(
+            city, UnitType.HORSEMAN, None, aggressive_civ, as_dict
+        ) == calculate_production_utility(city, UnitType.HORSEMAN, None, aggressive_civ, as_record)
+        assert calculate_research_utility(
+            "archery", aggressive_civ, as_dict
+        ) == calculate_research_utility("archery", aggressive_civ, as_record)
+
     def test_movement_utility_toward_enemy(self, player_civ, aggressive_civ, mock_game_state):
         """Test movement utility toward enemy units."""
         unit = create_warrior(aggressive_civ, 0, 0)
         enemy_unit = create_warrior(player_civ, 5, 5)
-        mock_game_state.get_all_units.return_value = [unit, enemy_unit]
-        mock_game_state.get_all_cities.return_value = []
+        mock_game_state.add_unit(unit)
+        mock_game_state.add_unit(enemy_unit)
 
         # Tile closer to enemy
         close_tile = Tile(x=3, y=3, terrain=TerrainType.GRASS)
@@ -135,6 +215,24 @@ class TestUtilityFunctions:
         # Closer should have higher utility for aggressive AI
         assert utility_close > utility_far
 
+    def test_movement_utility_with_enemy_snapshot(
+        self, player_civ, aggressive_civ, mock_game_state
+    ):
+        """Test a precomputed enemy snapshot scores moves like a live scan."""
+        unit = create_warrior(aggressive_civ, 0, 0)
+        enemy_unit = create_warrior(player_civ, 5, 5)
+        mock_game_state.add_unit(unit)
+        mock_game_state.add_unit(enemy_unit)
+
+        enemy_xy = get_enemy_positions(aggressive_civ, mock_game_state)
+        assert enemy_xy == [(5, 5)]
+
+        tile = Tile(x=3, y=3, terrain=TerrainType.GRASS)
+        weights = AI_PERSONALITIES["AGGRESSIVE"]
+        assert calculate_movement_utility(
+            unit, tile, mock_game_state, weights, enemy_xy
+        ) == calculate_movement_utility(unit, tile, mock_game_state, weights)
+
     def test_retreat_utility_based_on_health(self, aggressive_civ, mock_game_state):
         """Test retreat utility increases as health decreases."""
         unit = create_warrior(aggressive_civ, 0, 0)
@@ -193,7 +291,6 @@ class TestTacticalAI:
         unit = create_warrior(aggressive_civ, 5, 5)
         unit.owner = aggressive_civ
 
-        mock_game_state.get_cities_for_civ.return_value = []
         mock_game_state.grid.get_tile = MagicMock(
             return_value=Tile(x=5, y=5, terrain=TerrainType.GRASS)
         )
@@ -236,6 +333,122 @@ class TestTacticalAI:
                 # With enemy in range, should prefer attack
                 assert action.action_type == ActionType.ATTACK
 
+    def test_tactical_ai_search_avoids_lethal_reply(
+        self, aggressive_civ, player_civ, mock_game_state
+    ):
+        """Test lookahead rejects a move the enemy can punish with a kill."""
+        from unittest.mock import patch
+
+        unit = create_warrior(aggressive_civ, 5, 5)
+        unit.health = 12
+        enemy = create_warrior(player_civ, 9, 9)
+        mock_game_state.add_unit(unit)
+        mock_game_state.add_unit(enemy)
+
+        exposed_tile = Tile(x=8, y=8, terrain=TerrainType.GRASS)
+        safe_tile = Tile(x=2, y=2, terrain=TerrainType.GRASS)
+
+        with patch('src.ai.ai_tactics.get_tiles_in_attack_range', return_value=[]):
+            with patch(
+                'src.ai.ai_tactics.get_reachable_tiles',
+                return_value={exposed_tile: 1, safe_tile: 1}
+            ):
+                greedy = TacticalAI(AI_PERSONALITIES["AGGRESSIVE"], search_depth=1)
+                searching = TacticalAI(AI_PERSONALITIES["AGGRESSIVE"])
+
+                assert greedy.decide_action(unit, mock_game_state).target_tile is exposed_tile
+                assert searching.decide_action(unit, mock_game_state).target_tile is not exposed_tile
+
+    def test_reachable_cache_invalidated_on_move(
+        self, aggressive_civ, mock_game_state
+    ):
+        """Test reachable tiles are reused until the unit moves."""
+        from unittest.mock import patch
+
+        tactical_ai = TacticalAI(AI_PERSONALITIES["AGGRESSIVE"])
+        unit = create_warrior(aggressive_civ, 5, 5)
+        mock_game_state.add_unit(unit)
+
+        with patch('src.ai.ai_tactics.get_reachable_tiles', return_value={}) as reachable:
+            tactical_ai.decide_action(unit, mock_game_state)
+            tactical_ai.decide_action(unit, mock_game_state)
+            assert reachable.call_count == 1
+
+            move = TacticalAction(
+                action_type=ActionType.MOVE,
+                target_tile=mock_game_state.grid.get_tile(6, 5)
+            )
+            assert tactical_ai.execute_action(move, unit, mock_game_state)
+
+            tactical_ai.decide_action(unit, mock_game_state)
+            assert reachable.call_count == 2
+
+    def test_retreat_path_cached_until_reset(self, aggressive_civ, mock_game_state):
+        """Test retreat pathfinding is reused until caches are reset."""
+        from unittest.mock import patch
+        from src.ai import ai_tactics
+
+        tactical_ai = TacticalAI(AI_PERSONALITIES["BALANCED"])
+        unit = create_warrior(aggressive_civ, 5, 5)
+        unit.health = unit.max_health // 4
+        mock_game_state.add_unit(unit)
+        mock_game_state.add_city(City(name="Capital", owner=aggressive_civ, x=1, y=5))
+
+        with patch('src.ai.ai_tactics.find_path', wraps=ai_tactics.find_path) as find:
+            tactical_ai.decide_action(unit, mock_game_state)
+            tactical_ai.decide_action(unit, mock_game_state)
+            assert find.call_count == 1
+
+            tactical_ai.reset_caches()
+            tactical_ai.decide_action(unit, mock_game_state)
+            assert find.call_count == 2
+
+    def test_enemy_replies_reused_until_reset(
+        self, aggressive_civ, player_civ, mock_game_state
+    ):
+        """Test enemy replies are computed once per turn until caches reset."""
+        from unittest.mock import patch
+        from src.systems.combat_system import CombatSystem
+
+        tactical_ai = TacticalAI(AI_PERSONALITIES["AGGRESSIVE"])
+        unit = create_warrior(aggressive_civ, 5, 5)
+        mock_game_state.add_unit(unit)
+        mock_game_state.add_unit(create_warrior(player_civ, 8, 5))
+
+        expected = CombatSystem.calculate_expected_damage
+        with patch.object(CombatSystem, 'calculate_expected_damage', wraps=expected) as damage:
+            first = tactical_ai.decide_action(unit, mock_game_state)
+            calls = damage.call_count
+            assert calls > 0
+
+            assert tactical_ai.decide_action(unit, mock_game_state) == first
+            assert damage.call_count == calls
+
+            tactical_ai.reset_caches()
+            tactical_ai.decide_action(unit, mock_game_state)
+            assert damage.call_count == 2 * calls
+
+    def test_enemy_replies_measured_from_hypothetical_tile(
+        self, aggressive_civ, player_civ, mock_game_state
+    ):
+        """Test enemy replies are scored against the tile, not the unit's position."""
+        from src.systems.combat_system import CombatSystem
+
+        tactical_ai = TacticalAI(AI_PERSONALITIES["AGGRESSIVE"])
+        unit = create_warrior(aggressive_civ, 5, 5)
+        archer = create_archer(player_civ, 8, 5)
+        mock_game_state.add_unit(unit)
+        mock_game_state.add_unit(archer)
+        tile = mock_game_state.grid.get_tile(6, 5)
+
+        (penalty, enemy), = tactical_ai._get_enemy_replies(unit, tile, mock_game_state)
+
+        at_tile, _ = CombatSystem.calculate_expected_damage(archer, unit, tile, 2)
+        from_unit, _ = CombatSystem.calculate_expected_damage(archer, unit, tile)
+        assert enemy is archer
+        assert at_tile != from_unit
+        assert penalty == at_tile / unit.max_health
+
     def test_tactical_ai_fortifies_when_no_options(
         self, aggressive_civ, mock_game_state
     ):
@@ -247,8 +460,6 @@ class TestTacticalAI:
         unit._can_attack = False
         unit._can_move = False
 
-        mock_game_state.get_cities_for_civ.return_value = []
-
         action = tactical_ai.decide_action(unit, mock_game_state)
 
         # Should fortify when can't move or attack
@@ -262,12 +473,8 @@ class TestStrategicAI:
         """Test strategic AI can assess situation."""
         strategic_ai = StrategicAI(AI_PERSONALITIES["AGGRESSIVE"])
 
-        mock_game_state.get_units_for_civ.return_value = [
-            create_warrior(aggressive_civ, 0, 0)
-        ]
-        mock_game_state.get_cities_for_civ.return_value = [
-            City(name="Capital", owner=aggressive_civ, x=5, y=5)
-        ]
+        mock_game_state.add_unit(create_warrior(aggressive_civ, 0, 0))
+        mock_game_state.add_city(City(name="Capital", owner=aggressive_civ, x=5, y=5))
 
         assessment = strategic_ai.assess_situation(aggressive_civ, mock_game_state)
 
@@ -286,7 +493,7 @@ class TestStrategicAI:
 
         # Our city
         our_city = City(name="Capital", owner=aggressive_civ, x=5, y=5)
-        mock_game_state.get_cities_for_civ.return_value = [our_city]
+        mock_game_state.add_city(our_city)
 
         # Enemy units very close to our city
         enemy_units = [
@@ -295,15 +502,7 @@ class TestStrategicAI:
             create_warrior(player_civ, 7, 5),  # Distance 2
         ]
         for unit in enemy_units:
-            unit.owner = player_civ
-
-        # Mock to return no units for our civ but enemies for others
-        def get_units_for_civ(civ):
-            if civ == aggressive_civ:
-                return []
-            return enemy_units
-
-        mock_game_state.get_units_for_civ.side_effect = get_units_for_civ
+            mock_game_state.add_unit(unit)
 
         assessment = strategic_ai.assess_situation(aggressive_civ, mock_game_state)
 
@@ -314,6 +513,27 @@ class TestStrategicAI:
             StrategicGoal.BUILD_MILITARY
         )
 
+    def test_assessment_skips_refinements_without_budget(
+        self, aggressive_civ, player_civ, mock_game_state
+    ):
+        """Test an exhausted time budget still yields the coarse assessment."""
+        from src.ai.ai_strategies import UNASSESSED_EXPANSION, UNASSESSED_THREAT
+
+        strategic_ai = StrategicAI(AI_PERSONALITIES["BALANCED"])
+        mock_game_state.add_city(City(name="Capital", owner=aggressive_civ, x=5, y=5))
+        mock_game_state.add_unit(create_warrior(player_civ, 6, 5))
+
+        full = strategic_ai.assess_situation(aggressive_civ, mock_game_state)
+        coarse = strategic_ai.assess_situation(
+            aggressive_civ, mock_game_state, time_budget_ms=0
+        )
+
+        assert coarse.military_strength == full.military_strength
+        assert coarse.economic_strength == full.economic_strength
+        assert coarse.threat_level == UNASSESSED_THREAT
+        assert coarse.expansion_potential == UNASSESSED_EXPANSION
+        assert full.threat_level > 0
+
     def test_strategic_ai_decides_production(
         self, aggressive_civ, mock_game_state
     ):
@@ -329,6 +549,30 @@ class TestStrategicAI:
         # City should now be producing something
         assert city.is_producing or city.current_production is None  # May be None if no units available
 
+    def test_production_memoized_within_turn(self, aggressive_civ, mock_game_state):
+        """Test cities with the same civ state reuse the first production choice."""
+        from unittest.mock import patch
+
+        strategic_ai = StrategicAI(AI_PERSONALITIES["AGGRESSIVE"])
+        first = City(name="First", owner=aggressive_civ, x=2, y=2)
+        second = City(name="Second", owner=aggressive_civ, x=7, y=7)
+        third = City(name="Third", owner=aggressive_civ, x=2, y=7)
+
+        with patch(
+            'src.ai.ai_strategies.calculate_production_utility',
+            wraps=calculate_production_utility
+        ) as utility:
+            strategic_ai.decide_production(first, aggressive_civ, mock_game_state)
+            calls = utility.call_count
+            strategic_ai.decide_production(second, aggressive_civ, mock_game_state)
+            assert utility.call_count == calls
+            assert second.current_production == first.current_production
+
+            strategic_ai.decide_production(
+                third, aggressive_civ, mock_game_state, use_memo=False
+            )
+            assert utility.call_count == calls * 2
+
 
 class TestAIController:
     """Tests for main AI controller."""
@@ -357,6 +601,7 @@ class TestAIController:
         """Test AI controller does nothing if civilization is eliminated."""
         controller = AIController(aggressive_civ)
         aggressive_civ.is_eliminated = True
+        mock_game_state.get_units_for_civ = MagicMock(wraps=mock_game_state.get_units_for_civ)
 
         # Should not raise an error, just return early
         controller.take_turn(mock_game_state)
@@ -374,8 +619,8 @@ class TestAIController:
         warrior._can_attack = False
         warrior._can_move = False
 
-        mock_game_state.get_units_for_civ.return_value = [warrior]
-        mock_game_state.get_cities_for_civ.return_value = []
+        mock_game_state.add_unit(warrior)
+        mock_game_state.get_units_for_civ = MagicMock(wraps=mock_game_state.get_units_for_civ)
 
         # Should process without error
         controller.take_turn(mock_game_state)
@@ -389,27 +634,13 @@ class TestAIIntegration:
 
     def test_full_ai_turn_with_units(self, aggressive_civ, player_civ, small_grid):
         """Test a complete AI turn with units on real grid."""
-        game_state = MagicMock()
-        game_state.grid = small_grid
-        game_state.active_civs = [player_civ, aggressive_civ]
+        game_state = FakeGameState(grid=small_grid, active_civs=[player_civ, aggressive_civ])
 
-        # Place units - set remaining_movement to 0 to avoid infinite loop
-        # (mocked move_unit doesn't reduce movement)
+        # The fake moves units for real, so the AI spends its movement
         ai_warrior = create_warrior(aggressive_civ, 2, 2)
-        ai_warrior.owner = aggressive_civ
-        ai_warrior.remaining_movement = 0  # Can't move
-        ai_warrior.has_attacked = True  # Can't attack
-
         player_unit = create_warrior(player_civ, 7, 7)
-        player_unit.owner = player_civ
-
-        game_state.get_units_for_civ = MagicMock(
-            side_effect=lambda civ: [ai_warrior] if civ == aggressive_civ else [player_unit]
-        )
-        game_state.get_cities_for_civ = MagicMock(return_value=[])
-        game_state.get_all_units = MagicMock(return_value=[ai_warrior, player_unit])
-        game_state.get_all_cities = MagicMock(return_value=[])
-        game_state.move_unit = MagicMock(return_value=True)
+        game_state.add_unit(ai_warrior)
+        game_state.add_unit(player_unit)
 
         controller = AIController(aggressive_civ)
 
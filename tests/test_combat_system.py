@@ -123,6 +123,35 @@ class TestDamageCalculation:
 
         assert damage >= 1
 
+    def test_damage_matches_exact_arithmetic(self, player_civ, enemy_civ):
+        """Fixed-point damage equals the exactly computed formula, floored once."""
+        from fractions import Fraction
+        from src.data.unit_data import UnitType
+        from src.entities.unit_types import create_unit
+
+        for attacker_type in UnitType:
+            attacker = create_unit(attacker_type, player_civ, 0, 0)
+            distances = {1, attacker.range}
+            for defender_type in UnitType:
+                defender = create_unit(defender_type, enemy_civ, 1, 0)
+                base = Fraction(attacker.attack * 100, 100 + defender.defense)
+                for terrain in TerrainType:
+                    tile = Tile(x=1, y=0, terrain=terrain)
+                    terrain_modifier = 1 - Fraction(tile.defense_bonus)
+                    for health in range(1, attacker.max_health + 1):
+                        attacker.health = health
+                        health_modifier = Fraction(attacker.max_health + health,
+                                                   2 * attacker.max_health)
+                        for distance in distances:
+                            range_modifier = Fraction(3, 4) if (
+                                attacker.is_ranged and distance == attacker.range
+                            ) else 1
+                            exact = int(base * terrain_modifier * health_modifier
+                                        * range_modifier)
+                            assert CombatSystem.calculate_damage(
+                                attacker, defender, tile, distance
+                            ) == max(1, exact)
+
 
 class TestCounterattack:
     """Tests for counterattack logic."""
@@ -163,6 +192,70 @@ class TestCounterattack:
 
         assert not CombatSystem.can_counterattack(defender, attacker, distance=1)
 
+    def test_unit_flags_track_state(self, player_civ):
+        """Unit flags reflect combat type and live health."""
+        from src.data.unit_data import UNIT_FLAG_ALIVE, UNIT_FLAG_MELEE, UNIT_FLAG_RANGED
+
+        warrior = create_warrior(player_civ, 0, 0)
+        archer = create_archer(player_civ, 1, 0)
+
+        assert warrior.flags == UNIT_FLAG_ALIVE | UNIT_FLAG_MELEE
+        assert archer.flags == UNIT_FLAG_ALIVE | UNIT_FLAG_RANGED
+
+        archer.health = 0
+        assert archer.flags == UNIT_FLAG_RANGED
+
+    def test_counter_table_matches_rules(self, player_civ, enemy_civ):
+        """Table lookup agrees with the written counterattack rules."""
+        from src.data.unit_data import UnitType
+        from src.entities.unit_types import create_unit
+
+        for defender_type in UnitType:
+            for attacker_type in UnitType:
+                for health in (0, 50):
+                    defender = create_unit(defender_type, enemy_civ, 0, 0)
+                    attacker = create_unit(attacker_type, player_civ, 0, 0)
+                    defender.health = health
+                    for distance in range(5):
+                        expected = (
+                            defender.is_alive
+                            and not (distance > 1 and defender.is_melee and attacker.is_ranged)
+                            and defender.can_attack_at_range(distance)
+                        )
+                        assert CombatSystem.can_counterattack(
+                            defender, attacker, distance
+                        ) == expected
+
+    def test_terrain_modifiers_cover_every_terrain(self):
+        """Damage modifier table has one entry per terrain, in value order."""
+        from src.map.tile import TERRAIN_PROPERTIES
+        from src.systems.combat_system import TERRAIN_DAMAGE_MODIFIERS
+        from src.systems._combat_kernels import FIXED_POINT_ONE
+
+        assert len(TERRAIN_DAMAGE_MODIFIERS) == len(TerrainType)
+        for terrain in TerrainType:
+            bonus = TERRAIN_PROPERTIES[terrain]["defense_bonus"]
+            modifier = TERRAIN_DAMAGE_MODIFIERS[terrain.value - 1]
+            assert modifier == int((1 - bonus) * FIXED_POINT_ONE)
+
+    def test_units_share_type_stats(self, player_civ, enemy_civ):
+        """Units of one type reference a single shared stats instance."""
+        from src.data.unit_data import UnitType, get_unit_stats
+
+        first = create_warrior(player_civ, 0, 0)
+        second = create_warrior(enemy_civ, 1, 0)
+
+        assert first.stats is second.stats is get_unit_stats(UnitType.WARRIOR)
+        assert first.attack == first.stats.attack
+
+    def test_owner_id_follows_owner(self, player_civ, enemy_civ):
+        """owner_id tracks the owner, including reassignment."""
+        unit = create_warrior(player_civ, 0, 0)
+        assert unit.owner_id == player_civ.civ_id
+
+        unit.owner = enemy_civ
+        assert unit.owner_id == enemy_civ.civ_id != player_civ.civ_id
+
 
 class TestCombatResolution:
     """Tests for full combat resolution."""
@@ -226,6 +319,25 @@ class TestCombatResolution:
         assert not defender.is_alive
         assert result.defender_killed
 
+    def test_combat_result_is_immutable_tuple(self, player_civ, enemy_civ):
+        """Combat results are lightweight immutable records."""
+        attacker = create_warrior(player_civ, 0, 0)
+        defender = create_warrior(enemy_civ, 1, 0)
+        grass = Tile(x=1, y=0, terrain=TerrainType.GRASS)
+
+        result = CombatSystem.resolve_combat(attacker, defender, grass, grass)
+
+        assert isinstance(result, tuple)
+        assert result == (
+            result.attacker_damage,
+            result.defender_damage,
+            result.attacker_killed,
+            result.defender_killed,
+        )
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.defender_damage = 0
+
 
 class TestCombatOdds:
     """Tests for combat odds calculation."""
@@ -252,3 +364,25 @@ class TestCombatOdds:
         odds_forest = CombatSystem.get_combat_odds(attacker, defender, forest_tile)
 
         assert odds_forest < odds_grass
+
+    def test_odds_matrix_matches_pairwise(self, player_civ, enemy_civ):
+        """Batched odds should equal per-pair expected damage."""
+        grass = Tile(x=0, y=0, terrain=TerrainType.GRASS)
+        forest = Tile(x=0, y=0, terrain=TerrainType.FOREST)
+        attackers = [
+            create_warrior(player_civ, 0, 0),
+            create_archer(player_civ, 0, 1),
+        ]
+        attackers[0].health = 40
+        defenders = [
+            create_warrior(enemy_civ, 1, 0),
+            create_archer(enemy_civ, 2, 1),
+        ]
+        tiles = [grass, forest]
+
+        matrix = CombatSystem.calculate_odds_matrix(attackers, defenders, tiles)
+
+        for i, attacker in enumerate(attackers):
+            for j, defender in enumerate(defenders):
+                expected = CombatSystem.calculate_expected_damage(attacker, defender, tiles[j])
+                assert matrix[i][j] == expected
@@ -6,6 +6,7 @@ from unittest.mock import patch, MagicMock
 from src.core.game_state import GameState, GamePhase
 from src.map.map_generator import generate_game_map
 from src.map.pathfinding import get_reachable_tiles
+from src.map.tile import Tile
 from src.entities.civilization import Civilization
 from src.entities.city import City
 from src.entities.unit_types import create_warrior, create_archer
@@ -30,9 +31,9 @@ class TestGameInitialization:
         assert grid.width == 40
         assert grid.height == 30
 
-    def test_game_state_creation_with_civs(self):
+    def test_game_state_creation_with_civs(self, generated_game_map):
         """Test creating game state with civilizations."""
-        grid, positions = generate_game_map(
+        grid, positions = generated_game_map(
             width=20,
             height=15,
             num_civs=2,
@@ -51,9 +52,9 @@ class TestGameInitialization:
         assert len(game_state.ai_civs) == 1
         assert game_state.current_turn == 1
 
-    def test_starting_units_placement(self):
+    def test_starting_units_placement(self, generated_game_map):
         """Test placing starting units at valid positions."""
-        grid, positions = generate_game_map(
+        grid, positions = generated_game_map(
             width=20,
             height=15,
             num_civs=2,
@@ -80,9 +81,9 @@ class TestGameInitialization:
 class TestCombatIntegration:
     """Integration tests for combat system."""
 
-    def test_full_combat_sequence(self):
+    def test_full_combat_sequence(self, generated_game_map):
         """Test a complete combat sequence."""
-        grid, _ = generate_game_map(width=10, height=10, num_civs=2, seed=42)
+        grid, _ = generated_game_map(width=10, height=10, num_civs=2, seed=42)
 
         player = Civilization(name="Player", color_key="PLAYER")
         enemy = Civilization(name="Enemy", color_key="AI_AGGRESSIVE", is_ai=True)
@@ -127,9 +128,9 @@ class TestCombatIntegration:
 class TestAIIntegration:
     """Integration tests for AI system."""
 
-    def test_ai_processes_turn_without_error(self):
+    def test_ai_processes_turn_without_error(self, generated_game_map):
         """Test that AI can process a full turn."""
-        grid, positions = generate_game_map(
+        grid, positions = generated_game_map(
             width=20,
             height=15,
             num_civs=2,
@@ -171,9 +172,9 @@ class TestAIIntegration:
 class TestFogOfWar:
     """Tests for fog of war system."""
 
-    def test_visibility_updates_from_units(self):
+    def test_visibility_updates_from_units(self, generated_game_map):
         """Test that visibility updates based on unit positions."""
-        grid, positions = generate_game_map(
+        grid, positions = generated_game_map(
             width=15,
             height=15,
             num_civs=2,
@@ -200,9 +201,9 @@ class TestFogOfWar:
         assert (start_x, start_y) in fog
         assert fog[(start_x, start_y)] == "VISIBLE"
 
-    def test_visibility_persists_as_explored(self):
+    def test_visibility_persists_as_explored(self, generated_game_map):
         """Test that previously visible tiles become explored."""
-        grid, positions = generate_game_map(
+        grid, positions = generated_game_map(
             width=15,
             height=15,
             num_civs=2,
@@ -238,13 +239,79 @@ class TestFogOfWar:
                 state = game_state.fog_states[player.name].get((start_x, start_y))
                 assert state == "EXPLORED"
 
+    def test_fog_grid_matches_fog_states(self, generated_game_map):
+        """Test that the fog byte grid mirrors the fog dict."""
+        from src.core.settings import FOG_UNEXPLORED, FOG_EXPLORED, FOG_VISIBLE
+
+        grid, positions = generated_game_map(width=15, height=15, num_civs=2, seed=42)
+        player = Civilization(name="Player", color_key="PLAYER", is_ai=False)
+        game_state = GameState(grid=grid, civilizations=[player])
+
+        start_x, start_y = positions[0]
+        warrior = create_warrior(player, start_x, start_y)
+        game_state.add_unit(warrior)
+        game_state.update_visibility(player)
+
+        game_state.remove_unit(warrior)
+        game_state.add_unit(create_warrior(player, *positions[1]))
+        game_state.update_visibility(player)
+
+        codes = {"EXPLORED": FOG_EXPLORED, "VISIBLE": FOG_VISIBLE}
+        fog = game_state.fog_states[player.name]
+        fog_grid = game_state.get_fog_grid(player)
+        for y in range(grid.height):
+            for x in range(grid.width):
+                expected = codes.get(fog.get((x, y)), FOG_UNEXPLORED)
+                assert fog_grid[y * grid.width + x] == expected
+
+    def test_fog_bitsets_match_lookups(self, generated_game_map):
+        """Test that visible and explored bitsets agree with per-tile lookups."""
+        grid, positions = generated_game_map(width=15, height=15, num_civs=2, seed=42)
+        player = Civilization(name="Player", color_key="PLAYER", is_ai=False)
+        game_state = GameState(grid=grid, civilizations=[player])
+
+        warrior = create_warrior(player, *positions[0])
+        game_state.add_unit(warrior)
+        game_state.update_visibility(player)
+        game_state.remove_unit(warrior)
+        game_state.add_unit(create_warrior(player, *positions[1]))
+        game_state.update_visibility(player)
+
+        fog = game_state.get_civ_fog(player)
+        states = dict(fog.items())
+        assert fog.visible.bit_count() == list(states.values()).count("VISIBLE")
+        assert (fog.visible | fog.explored).bit_count() == len(states)
+        assert game_state.get_fog_state(player, *positions[1]) == "VISIBLE"
+
+    def test_visibility_rebuilt_only_when_sources_change(self, generated_game_map):
+        """Test fog is left alone until a unit or city that sees changes."""
+        grid, positions = generated_game_map(width=15, height=15, num_civs=2, seed=42)
+        player = Civilization(name="Player", color_key="PLAYER", is_ai=False)
+        game_state = GameState(grid=grid, civilizations=[player])
+
+        warrior = create_warrior(player, *positions[0])
+        game_state.add_unit(warrior)
+        game_state.update_visibility(player)
+        fog = game_state.get_civ_fog(player)
+
+        with patch.object(fog, 'begin_update', wraps=fog.begin_update) as begin:
+            game_state.update_visibility(player)
+            assert begin.call_count == 0
+
+            game_state.remove_unit(warrior)
+            game_state.add_unit(create_warrior(player, *positions[1]))
+            game_state.update_visibility(player)
+            assert begin.call_count == 1
+
+        assert game_state.get_fog_state(player, *positions[0]) == "EXPLORED"
+
 
 class TestVictoryConditions:
     """Tests for victory conditions."""
 
-    def test_elimination_victory(self):
+    def test_elimination_victory(self, generated_game_map):
         """Test that eliminating all enemies triggers victory."""
-        grid, positions = generate_game_map(
+        grid, positions = generated_game_map(
             width=10,
             height=10,
             num_civs=2,
@@ -272,13 +339,32 @@ class TestVictoryConditions:
         assert winner == player
         assert game_state.phase == GamePhase.GAME_OVER
 
+    def test_victory_detected_when_last_unit_removed(self, generated_game_map):
+        """Victory is found on the same check that eliminates the last rival."""
+        grid, positions = generated_game_map(width=10, height=10, num_civs=2, seed=42)
+
+        player = Civilization(name="Player", color_key="PLAYER", is_ai=False)
+        enemy = Civilization(name="Enemy", color_key="AI_AGGRESSIVE", is_ai=True)
+        game_state = GameState(grid=grid, civilizations=[player, enemy])
+
+        game_state.add_city(City(name="Capital", owner=player, x=positions[0][0], y=positions[0][1]))
+        warrior = create_warrior(enemy, positions[1][0], positions[1][1])
+        game_state.add_unit(warrior)
+        assert game_state.check_victory() is None
+
+        game_state.remove_unit(warrior)
+
+        assert enemy.unit_count == 0
+        assert game_state.check_victory() == player
+        assert enemy.is_eliminated
+
 
 class TestPathfindingIntegration:
     """Integration tests for pathfinding with real map."""
 
-    def test_reachable_tiles_on_generated_map(self):
+    def test_reachable_tiles_on_generated_map(self, generated_game_map):
         """Test pathfinding on generated map."""
-        grid, positions = generate_game_map(
+        grid, positions = generated_game_map(
             width=15,
             height=15,
             num_civs=2,
@@ -339,3 +425,21 @@ class TestResourceSystem:
         assert player.resources[ResourceType.WOOD] == 50
         assert player.resources[ResourceType.STONE] == 30
         assert player.resources[ResourceType.GOLD] == 50
+
+    def test_city_tiles_cached_until_grid_changes(self, generated_game_map):
+        """Test that worked tiles are cached per city until a tile is replaced."""
+        from src.systems.resource_system import ResourceSystem
+
+        grid, positions = generated_game_map(40, 30, 2, seed=42)
+        game_state = GameState(grid=grid)
+        system = ResourceSystem(game_state)
+        cx, cy = positions[0]
+
+        tiles = system.get_city_tiles(cx, cy)
+        assert tiles == grid.get_tiles_in_range(cx, cy, 2)
+        assert system.get_city_tiles(cx, cy) is tiles
+
+        replacement = Tile(x=cx, y=cy, terrain=grid.get_tile(cx, cy).terrain)
+        grid.set_tile(cx, cy, replacement)
+        tiles = system.get_city_tiles(cx, cy)
+        assert any(t is replacement for t in tiles)
@@ -27,12 +27,8 @@ class TestMapGenerator:
         grid2 = gen2.generate_map(20, 20)
 
         # Check all tiles match
-        for y in range(20):
-            for x in range(20):
-                tile1 = grid1.get_tile(x, y)
-                tile2 = grid2.get_tile(x, y)
-                assert tile1.terrain == tile2.terrain
-                assert tile1.resource == tile2.resource
+        assert grid1.terrain_rows == grid2.terrain_rows
+        assert grid1.resource_rows == grid2.resource_rows
 
     def test_generator_produces_different_maps_with_different_seeds(self):
         """Different seeds should produce different maps."""
@@ -55,22 +51,27 @@ class TestMapGenerator:
 
     def test_generated_map_has_varied_terrain(self, generated_map):
         """Generated map should have multiple terrain types."""
-        terrain_counts = {}
-        for tile in generated_map.all_tiles():
-            terrain_counts[tile.terrain] = terrain_counts.get(tile.terrain, 0) + 1
+        terrain_counts = generated_map.terrain_histogram()
 
         # Should have at least 3 different terrain types
-        assert len(terrain_counts) >= 3
+        assert sum(1 for count in terrain_counts.values() if count) >= 3
 
         # Should have significant grass (most common land type)
-        assert terrain_counts.get(TerrainType.GRASS, 0) > 0
+        assert terrain_counts[TerrainType.GRASS] > 0
+
+    def test_terrain_histogram_counts_every_tile(self, generated_map):
+        """Terrain histogram should cover every terrain type and tile."""
+        histogram = generated_map.terrain_histogram()
+
+        assert set(histogram) == set(TerrainType)
+        assert sum(histogram.values()) == generated_map.width * generated_map.height
+        for terrain, count in histogram.items():
+            assert count == len(generated_map.find_tiles_by_terrain(terrain))
 
     def test_generated_map_has_resources(self, generated_map):
         """Generated map should have resources placed on tiles."""
-        resource_count = sum(1 for tile in generated_map.all_tiles() if tile.resource is not None)
-
         # Should have at least some resources
-        assert resource_count > 0
+        assert generated_map.count_resources() > 0
 
         # Should have multiple resource types
         resource_types = set(
@@ -94,12 +95,12 @@ class TestMapGenerator:
 
     def test_generated_map_has_passable_land(self, generated_map):
         """Generated map should have sufficient passable land."""
-        passable = list(generated_map.find_passable_tiles())
-        total = generated_map.width * generated_map.height
-        land_ratio = len(passable) / total
+        land_ratio = generated_map.passable_ratio()
 
-        # At least 30% should be passable
+        # At least 30% should be passable, matching a direct count
         assert land_ratio >= 0.3
+        total = generated_map.width * generated_map.height
+        assert land_ratio == pytest.approx(len(generated_map.find_passable_tiles()) / total)
 
 
 class TestStartingPositions:
@@ -190,7 +191,39 @@ class TestGenerateGameMap:
         grid2, pos2 = generate_game_map(30, 30, 2, seed=999)
 
         assert pos1 == pos2
-
-        for y in range(30):
-            for x in range(30):
-                assert grid1.get_tile(x, y).terrain == grid2.get_tile(x, y).terrain
+        assert grid1.terrain_rows == grid2.terrain_rows
+
+
+class TestTerrainTables:
+    """Tests for flat terrain lookup tables."""
+
+    def test_tables_match_terrain_properties(self):
+        """Tuple lookups should agree with TERRAIN_PROPERTIES for every terrain."""
+        from src.map.tile import Tile, TERRAIN_PROPERTIES
+
+        for terrain in TerrainType:
+            tile = Tile(0, 0, terrain)
+            props = TERRAIN_PROPERTIES[terrain]
+            assert tile.movement_cost == props["movement_cost"]
+            assert tile.defense_bonus == props["defense_bonus"]
+            assert tile.is_passable == props["passable"]
+
+
+class TestGridRanges:
+    """Tests for grid range queries."""
+
+    def test_tiles_in_range_match_manhattan_filter(self, small_grid):
+        """Range queries should match a brute-force Manhattan filter, including off-grid centers."""
+        for cx, cy in [(0, 0), (4, 5), (9, 9), (-2, 3), (11, 4), (5, -3)]:
+            for radius in range(4):
+                expected = [
+                    (x, y) for y in range(small_grid.height) for x in range(small_grid.width)
+                    if abs(x - cx) + abs(y - cy) <= radius
+                ]
+                in_range = small_grid.get_tiles_in_range(cx, cy, radius)
+                assert [(t.x, t.y) for t in in_range] == expected
+
+                at_range = small_grid.get_tiles_at_range(cx, cy, radius)
+                assert [(t.x, t.y) for t in at_range] == [
+                    (x, y) for x, y in expected if abs(x - cx) + abs(y - cy) == radius
+                ]
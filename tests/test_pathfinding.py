@@ -137,6 +137,18 @@ class TestFindPath:
         assert len(path) > 0
         assert path[-1] == goal
 
+    def test_path_cost_is_optimal(self, simple_grid):
+        """Path cost should match the cheapest route around forest."""
+        for x in range(3, 7):
+            simple_grid.get_tile(x, 5).terrain = TerrainType.FOREST
+
+        start = simple_grid.get_tile(2, 5)
+        goal = simple_grid.get_tile(8, 5)
+        path = find_path(simple_grid, start, goal)
+
+        # Stepping around the forest row (8 grass) beats crossing it (10)
+        assert get_path_cost(path) == 8
+
     def test_path_blocked_by_friendly_unit(self, simple_grid, player_civ):
         """Path should not pass through friendly units."""
         start = simple_grid.get_tile(0, 5)
@@ -157,6 +169,60 @@ class TestFindPath:
         assert blocking_tile not in path
 
 
+class TestTileCanEnter:
+    """Tests for Tile.can_enter ownership and passability checks."""
+
+    def test_passability_follows_terrain_changes(self, simple_grid):
+        """Changing terrain should update whether a tile can be entered."""
+        tile = simple_grid.get_tile(2, 2)
+        assert tile.can_enter()
+
+        tile.terrain = TerrainType.WATER
+        assert not tile.can_enter()
+
+        tile.terrain = TerrainType.FOREST
+        assert tile.can_enter()
+
+    def test_enemy_unit_can_be_entered(self, simple_grid, player_civ, enemy_civ):
+        """Occupied tiles are enterable only when the occupant is an enemy."""
+        tile = simple_grid.get_tile(4, 4)
+        tile.unit = create_warrior(enemy_civ, 4, 4)
+
+        assert tile.can_enter(create_warrior(player_civ, 3, 4))
+        assert not tile.can_enter(create_warrior(enemy_civ, 5, 4))
+        assert not tile.can_enter()
+
+    def test_get_tile_returns_shared_instance(self, simple_grid, player_civ):
+        """Repeated lookups return the grid's own tile instance."""
+        tile = simple_grid.get_tile(2, 3)
+        assert simple_grid.get_tile(2, 3) is tile
+
+        tile.unit = create_warrior(player_civ, 2, 3)
+        assert simple_grid.get_tile(2, 3).has_unit()
+        assert simple_grid.get_tile(-1, 3) is None
+
+    def test_step_costs_follow_terrain_changes(self, simple_grid):
+        """The grid's step-cost table is rebuilt once edited tiles are marked dirty."""
+        assert simple_grid.step_costs[2 * 10 + 2] == 1
+
+        simple_grid.get_tile(2, 2).terrain = TerrainType.WATER
+        simple_grid.get_tile(3, 2).terrain = TerrainType.FOREST
+        simple_grid.mark_dirty(2, 2)
+        simple_grid.mark_dirty(3, 2)
+
+        assert simple_grid.step_costs[2 * 10 + 2] is None
+        assert simple_grid.step_costs[2 * 10 + 3] == 2
+
+    def test_step_costs_unaffected_by_other_tiles(self, simple_grid):
+        """Building other grids or tiles does not invalidate a grid's table."""
+        step_costs = simple_grid.step_costs
+
+        Grid(5, 5).get_tile(1, 1).terrain = TerrainType.WATER
+        Tile(0, 0, TerrainType.MOUNTAIN)
+
+        assert simple_grid.step_costs is step_costs
+
+
 class TestGetReachableTiles:
     """Tests for reachable tiles calculation."""
 
@@ -90,6 +90,83 @@ class TestTechTreeAvailability:
         available_ids = {t.id for t in available}
         assert "bronze_working" in available_ids
 
+    def test_tech_bits_track_researched_techs(self, player_civ):
+        """Tech bitmask should follow research and reassignment of the set."""
+        from src.data.tech_data import TECH_INDEX, get_available_techs_for_mask, tech_mask
+
+        assert player_civ.tech_bits == 0
+
+        player_civ.research_complete("mining")
+        assert player_civ.tech_bits == 1 << TECH_INDEX["mining"]
+
+        player_civ.researched_techs = {"writing", "masonry", "mining"}
+        assert player_civ.tech_bits == tech_mask(player_civ.researched_techs)
+        researched = player_civ.researched_techs
+        assert [t.id for t in get_available_techs_for_mask(player_civ.tech_bits)] == [
+            t.id for t in TECHNOLOGIES.values()
+            if t.id not in researched and all(p in researched for p in t.prerequisites)
+        ]
+
+    def test_unit_unlocks_match_researched_set(self, player_civ):
+        """Mask-based unit unlocks should match the set-based lookup."""
+        from src.data.tech_data import get_available_units_for_mask
+        from src.data.unit_data import get_available_units
+
+        for researched in (set(), {"archery"}, {"mining", "bronze_working", "archery"}, set(TECHNOLOGIES)):
+            player_civ.researched_techs = set(researched)
+            assert get_available_units_for_mask(player_civ.tech_bits) == get_available_units(researched)
+
+    def test_available_techs_are_fresh_lists(self, tech_tree):
+        """Memoized availability should not leak mutations between callers."""
+        first = tech_tree.get_available()
+        expected = list(first)
+        first.clear()
+
+        assert tech_tree.get_available() == expected
+
+    def test_mask_checks_match_tech_definitions(self, tech_tree, player_civ):
+        """Mask-based availability and bonuses should agree with the tech data."""
+        player_civ.researched_techs = {"mining", "bronze_working", "archery"}
+        researched = player_civ.researched_techs
+
+        for tech in TECHNOLOGIES.values():
+            expected = tech.id not in researched and all(
+                p in researched for p in tech.prerequisites
+            )
+            assert tech_tree.can_research(tech.id) == expected
+        assert not tech_tree.can_research("no_such_tech")
+
+        for bonus in {name for t in TECHNOLOGIES.values() for name in t.bonuses}:
+            assert tech_tree.get_bonus(bonus) == sum(
+                TECHNOLOGIES[t].bonuses.get(bonus, 0) for t in researched
+            )
+
+    def test_researched_techs_cannot_be_edited_in_place(self, tech_tree, player_civ):
+        """In-place edits are rejected so tech_bits cannot fall out of sync."""
+        player_civ.research_complete("mining")
+        bits = player_civ.tech_bits
+
+        with pytest.raises(AttributeError):
+            player_civ.researched_techs.add("masonry")
+        with pytest.raises(AttributeError):
+            tech_tree.researched.add("masonry")
+
+        assert player_civ.researched_techs == {"mining"}
+        assert player_civ.tech_bits == bits
+        assert tech_tree.can_research("bronze_working")
+
+    def test_initial_techs_set_tech_bits(self):
+        """Techs passed at construction are researched and reflected in tech_bits."""
+        from dataclasses import replace
+
+        civ = Civilization(name="Player", color_key="PLAYER", initial_techs={"mining"})
+        assert civ.researched_techs == {"mining"}
+        assert TechTree(civ).can_research("bronze_working")
+
+        copy = replace(civ, name="Copy", initial_techs=civ.researched_techs)
+        assert copy.researched_techs == civ.researched_techs
+        assert copy.tech_bits == civ.tech_bits
+
 
 class TestTechResearch:
     """Tests for tech research functionality."""
@@ -213,3 +290,15 @@ class TestTechTreeIntegration:
         tech_tree.add_progress(10)
         turns = tech_tree.get_turns_remaining(research_per_turn=5)
         assert turns == 2
+
+    def test_turns_remaining_follows_civ_research(self, tech_tree):
+        """Research switched directly on the civ should not use a stale tech."""
+        tech_tree.start_research("agriculture")  # Cost: 20
+        assert tech_tree.get_turns_remaining(research_per_turn=5) == 4
+
+        tech_tree.civ.start_research("bronze_working")
+        cost = get_technology("bronze_working").cost
+        assert tech_tree.get_turns_remaining(research_per_turn=5) == -(-cost // 5)
+
+        tech_tree.civ.research_complete("bronze_working")
+        assert tech_tree.get_turns_remaining(research_per_turn=5) == 0